@@ -6,6 +6,11 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Start app
-from ai_context_studio.main import main
-main()
+# Start app (guarded so worker processes spawned on Windows don't relaunch it)
+if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+
+    from ai_context_studio.main import main
+    main()
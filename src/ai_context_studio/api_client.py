@@ -64,12 +64,18 @@ class GeminiAPIClient:
         """
         Configure the API client with an API key.
 
+        Reconfiguring with the key already in use is a no-op, so the
+        SDK setup is only redone when the key actually changes.
+
         Args:
             api_key: Google Gemini API key.
 
         Returns:
             True if configuration succeeded, False otherwise.
         """
+        if self._configured and api_key == self._api_key:
+            return True
+
         if not GENAI_AVAILABLE:
             logger.error("Cannot configure: google-generativeai not installed")
             return False
@@ -209,6 +209,7 @@ class AIContextStudioApp(ctk.CTk):
         self.tabview.add("\U0001F4CA Visualizer")
         self.visualizer_tab = VisualizerTab(
             self.tabview.tab("\U0001F4CA Visualizer"),
+            event_queue=self.event_queue,
             on_status_update=self._update_status
         )
         self.visualizer_tab.pack(fill="both", expand=True)
@@ -335,4 +336,6 @@ class AIContextStudioApp(ctk.CTk):
         """Handle window close event."""
         logger.info("Application closing")
         self.event_queue.stop()
+        self.setup_tab.shutdown()
+        self.visualizer_tab.shutdown()
         self.destroy()
@@ -46,6 +46,7 @@ CONFIG_DIR: Path = Path.home() / ".ai_context_studio"
 CONFIG_FILE: Path = CONFIG_DIR / "config.json"
 KEY_FILE: Path = CONFIG_DIR / ".keyfile"
 MODELS_CACHE_FILE: Path = CONFIG_DIR / "models_cache.json"
+SCAN_CACHE_DIR: Path = CONFIG_DIR / "scan_cache"
 
 # Token estimation settings
 TOKEN_FACTOR: int = 4  # Characters per token (approximate)
@@ -54,6 +55,9 @@ MODELS_CACHE_HOURS: int = 24
 # Maximum file size to process (1MB)
 MAX_FILE_SIZE: int = 1_000_000
 
+# Chunk size used when streaming file contents (64KB)
+READ_CHUNK_SIZE: int = 64 * 1024
+
 # Maximum directory depth for scanning
 MAX_SCAN_DEPTH: int = 20
 
@@ -13,12 +13,16 @@ This module contains all data structures used throughout the application:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from .constants import COLORS
+from .constants import COLORS, READ_CHUNK_SIZE
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class GenerationType(Enum):
@@ -233,7 +237,7 @@ class FocusArea(Enum):
     )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileInfo:
     """
     Information about a single file in the project.
@@ -251,6 +255,20 @@ class FileInfo:
     extension: str
     included: bool = True
 
+    def content_iter(self, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream the raw file contents without loading the whole file.
+
+        Args:
+            chunk_size: Maximum number of bytes per chunk.
+
+        Yields:
+            Successive byte chunks of the file.
+        """
+        with open(self.path, 'rb') as fh:
+            while chunk := fh.read(chunk_size):
+                yield chunk
+
 
 @dataclass
 class ExistingDoc:
@@ -271,7 +289,7 @@ class ExistingDoc:
     is_outdated: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanResult:
     """
     Result of a project directory scan.
@@ -292,7 +310,7 @@ class ScanResult:
     existing_docs: dict[str, ExistingDoc] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SmartPreset:
     """
     Configuration for smart documentation generation.
@@ -342,7 +360,7 @@ class SmartPreset:
         return "\n".join(parts)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationResult:
     """
     Result of a documentation generation attempt.
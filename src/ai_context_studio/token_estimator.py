@@ -20,6 +20,7 @@ import re
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -221,8 +222,8 @@ class ModelRegistry:
     DEFAULT_MODEL = "gemini-1.5-flash"
 
     @classmethod
-    def get_model(cls, model_name: str) -> ModelPricing:
-        """Get pricing info for a model."""
+    def find_model(cls, model_name: str) -> Optional[ModelPricing]:
+        """Look up pricing info for a model, or None if it is unknown."""
         clean_name = model_name.replace("models/", "").lower()
 
         if clean_name in cls.MODELS:
@@ -232,6 +233,15 @@ class ModelRegistry:
             if key in clean_name or clean_name in key:
                 return model
 
+        return None
+
+    @classmethod
+    def get_model(cls, model_name: str) -> ModelPricing:
+        """Get pricing info for a model."""
+        model = cls.find_model(model_name)
+        if model is not None:
+            return model
+
         logger.warning("Unknown model '%s', using default", model_name)
         return cls.MODELS[cls.DEFAULT_MODEL]
 
@@ -270,6 +280,7 @@ class TokenEstimator:
     }
 
     DEFAULT_RATIO: float = 4.0
+    DEFAULT_CONTEXT_WINDOW: int = 1_048_576
 
     @classmethod
     def detect_content_type(cls, text: str) -> ContentType:
@@ -329,6 +340,41 @@ class TokenEstimator:
         """Estimate expected output tokens."""
         return int(input_tokens * multiplier)
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_context_window(model_name: str) -> int:
+        """
+        Get the context window of a model, in tokens.
+
+        Results are memoized per model name.
+
+        Args:
+            model_name: Model id, optionally prefixed with "models/".
+
+        Returns:
+            The model's context window, or DEFAULT_CONTEXT_WINDOW for
+            unknown models.
+        """
+        model = ModelRegistry.find_model(model_name)
+        if model is None:
+            return TokenEstimator.DEFAULT_CONTEXT_WINDOW
+        return model.context_window
+
+    @classmethod
+    def calculate_usage_percentage(cls, tokens: int, model_name: str) -> float:
+        """
+        Calculate how much of a model's context window tokens would fill.
+
+        Args:
+            tokens: Token count.
+            model_name: Model id, optionally prefixed with "models/".
+
+        Returns:
+            Usage as a percentage; above 100 when the window is exceeded.
+        """
+        window = cls.get_context_window(model_name)
+        return (tokens / window) * 100 if window > 0 else 0.0
+
     @staticmethod
     def format_token_count(tokens: int) -> str:
         """Format token count for display."""
@@ -9,7 +9,8 @@ in the main thread.
 from __future__ import annotations
 
 import logging
-import queue
+import threading
+from collections import deque
 from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
@@ -31,10 +32,17 @@ class UIEventQueue:
 
     Attributes:
         _root: The root CTk window
-        _queue: Thread-safe queue for callbacks
+        _queue: Callbacks in FIFO order (deque append/popleft are atomic)
+        _latest: Coalesced callbacks keyed by update channel
+        _wake: Set by producers when there is work to drain
         _running: Whether the queue is active
+        POLL_INTERVAL_MS: Poll delay while callbacks are flowing
+        IDLE_POLL_INTERVAL_MS: Poll delay when nothing was queued
     """
 
+    POLL_INTERVAL_MS: int = 50
+    IDLE_POLL_INTERVAL_MS: int = 100
+
     def __init__(self, root: Any) -> None:
         """
         Initialize the event queue.
@@ -43,25 +51,49 @@ class UIEventQueue:
             root: The root CTk/Tk window.
         """
         self._root = root
-        self._queue: queue.Queue[
+        self._queue: deque[
             tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
-        ] = queue.Queue()
+        ] = deque()
+        self._latest: dict[
+            str, tuple[Callable[..., Any], tuple[Any, ...]]
+        ] = {}
+        self._wake = threading.Event()
         self._running = True
         self._poll()
 
     def _poll(self) -> None:
         """Poll the queue and execute pending callbacks."""
-        while not self._queue.empty():
+        if not self._wake.is_set():
+            if self._running:
+                self._root.after(self.IDLE_POLL_INTERVAL_MS, self._poll)
+            return
+
+        # Clear before draining so callbacks queued meanwhile re-arm it
+        self._wake.clear()
+
+        # Coalesced updates run first so queued completion handlers
+        # always have the final word on the widgets they share
+        for _ in range(len(self._latest)):
             try:
-                callback, args, kwargs = self._queue.get_nowait()
-                callback(*args, **kwargs)
-            except queue.Empty:
+                callback, args = self._latest.popitem()[1]
+                callback(*args)
+            except KeyError:
                 break
+            except Exception as e:
+                logger.error("Error executing coalesced callback: %s", e)
+
+        while True:
+            try:
+                callback, args, kwargs = self._queue.popleft()
+            except IndexError:
+                break
+            try:
+                callback(*args, **kwargs)
             except Exception as e:
                 logger.error("Error executing queued callback: %s", e)
 
         if self._running:
-            self._root.after(50, self._poll)
+            self._root.after(self.POLL_INTERVAL_MS, self._poll)
 
     def put(
         self,
@@ -77,7 +109,28 @@ class UIEventQueue:
             *args: Positional arguments to pass.
             **kwargs: Keyword arguments to pass.
         """
-        self._queue.put((callback, args, kwargs))
+        self._queue.append((callback, args, kwargs))
+        self._wake.set()
+
+    def put_latest(
+        self,
+        key: str,
+        callback: Callable[..., Any],
+        *args: Any
+    ) -> None:
+        """
+        Queue a callback, replacing any pending one with the same key.
+
+        Only the most recent callback per key runs on the next poll,
+        which bounds UI work for high-frequency updates like progress.
+
+        Args:
+            key: Update channel identifier.
+            callback: Function to call.
+            *args: Positional arguments to pass.
+        """
+        self._latest[key] = (callback, args)
+        self._wake.set()
 
     def stop(self) -> None:
         """Stop the event queue polling."""
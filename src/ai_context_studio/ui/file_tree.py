@@ -10,6 +10,8 @@ from __future__ import annotations
 import logging
 import os
 import tkinter as tk
+from array import array
+from itertools import compress
 from tkinter import ttk
 from typing import Any, Callable, Optional
 
@@ -32,8 +34,17 @@ class OptimizedFileTree(ctk.CTkFrame):
     - Bulk selection operations
     - Visual indicators for selection state
 
+    Selection state is also kept column-wise (sizes array plus an
+    included mask, indexed by position in ``_files``) so totals and
+    lookups don't have to walk FileInfo objects.
+
     Attributes:
         _files: List of FileInfo objects
+        _sizes: File sizes, parallel to ``_files``
+        _included_mask: 1 for included files, parallel to ``_files``
+        _index_by_path: Relative path to position in ``_files``
+        _included_bytes: Running total size of included files
+        _selection_version: Bumped whenever the included set changes
         _on_change_callback: Callback for selection changes
         tree: The ttk.Treeview widget
     """
@@ -49,6 +60,11 @@ class OptimizedFileTree(ctk.CTkFrame):
         super().__init__(master, **kwargs)
 
         self._files: list[FileInfo] = []
+        self._sizes: array = array('q')
+        self._included_mask = bytearray()
+        self._index_by_path: dict[str, int] = {}
+        self._included_bytes: int = 0
+        self._selection_version: int = 0
         self._on_change_callback: Optional[Callable[[], None]] = None
 
         self._setup_style()
@@ -233,14 +249,10 @@ class OptimizedFileTree(ctk.CTkFrame):
         """Toggle selection for all tree-selected items."""
         selected = self.tree.selection()
         for item in selected:
-            tags = self.tree.item(item, "tags")
-            if len(tags) >= 2:
-                rel_path = tags[1]
-                for f in self._files:
-                    if f.relative_path == rel_path:
-                        f.included = not f.included
-                        self._update_item_display(item, f)
-                        break
+            idx = self._index_for_item(item)
+            if idx is not None:
+                self._set_included(idx, not self._included_mask[idx])
+                self._update_item_display(item, self._files[idx])
         self._notify_change()
 
     def _set_items_included(self, items: tuple, included: bool) -> None:
@@ -252,16 +264,46 @@ class OptimizedFileTree(ctk.CTkFrame):
             included: Whether to include or exclude.
         """
         for item in items:
-            tags = self.tree.item(item, "tags")
-            if len(tags) >= 2:
-                rel_path = tags[1]
-                for f in self._files:
-                    if f.relative_path == rel_path:
-                        f.included = included
-                        self._update_item_display(item, f)
-                        break
+            idx = self._index_for_item(item)
+            if idx is not None:
+                self._set_included(idx, included)
+                self._update_item_display(item, self._files[idx])
         self._notify_change()
 
+    def _index_for_item(self, item: str) -> Optional[int]:
+        """
+        Get the position in ``_files`` of the file shown by a tree item.
+
+        Args:
+            item: Tree item ID.
+
+        Returns:
+            Index of the file, or None for folders and unknown items.
+        """
+        tags = self.tree.item(item, "tags")
+        if len(tags) >= 2:
+            return self._index_by_path.get(tags[1])
+        return None
+
+    def _set_included(self, idx: int, included: bool) -> None:
+        """
+        Set a file's included flag, keeping the mask, size total and
+        selection version in sync.
+
+        Args:
+            idx: Position of the file in ``_files``.
+            included: Whether to include or exclude.
+        """
+        if self._included_mask[idx] == included:
+            return
+        self._included_mask[idx] = included
+        self._files[idx].included = included
+        self._selection_version += 1
+        if included:
+            self._included_bytes += self._sizes[idx]
+        else:
+            self._included_bytes -= self._sizes[idx]
+
     def _update_item_display(self, item: str, file_info: FileInfo) -> None:
         """
         Update the visual display of a tree item.
@@ -301,6 +343,13 @@ class OptimizedFileTree(ctk.CTkFrame):
             files: List of FileInfo objects to display.
         """
         self._files = files
+        self._sizes = array('q', [f.size for f in files])
+        self._included_mask = bytearray(f.included for f in files)
+        self._index_by_path = {
+            f.relative_path: idx for idx, f in enumerate(files)
+        }
+        self._included_bytes = sum(compress(self._sizes, self._included_mask))
+        self._selection_version += 1
 
         # Clear existing items
         for item in self.tree.get_children():
@@ -390,14 +439,10 @@ class OptimizedFileTree(ctk.CTkFrame):
         if not item:
             return
 
-        tags = self.tree.item(item, "tags")
-        if len(tags) >= 2 and tags[0] != "folder":
-            rel_path = tags[1]
-            for f in self._files:
-                if f.relative_path == rel_path:
-                    f.included = not f.included
-                    self._update_item_display(item, f)
-                    break
+        idx = self._index_for_item(item)
+        if idx is not None:
+            self._set_included(idx, not self._included_mask[idx])
+            self._update_item_display(item, self._files[idx])
 
         self._notify_change()
 
@@ -427,6 +472,16 @@ class OptimizedFileTree(ctk.CTkFrame):
         if self._on_change_callback:
             self._on_change_callback()
 
+    @property
+    def total_included_size(self) -> int:
+        """Total size in bytes of the currently included files."""
+        return self._included_bytes
+
+    @property
+    def selection_version(self) -> int:
+        """Counter that changes whenever the set of included files changes."""
+        return self._selection_version
+
     def get_included_files(self) -> list[FileInfo]:
         """
         Get list of included files.
@@ -434,4 +489,4 @@ class OptimizedFileTree(ctk.CTkFrame):
         Returns:
             List of FileInfo objects marked as included.
         """
-        return [f for f in self._files if f.included]
+        return list(compress(self._files, self._included_mask))
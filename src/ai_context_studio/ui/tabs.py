@@ -10,21 +10,24 @@ Contains the main application tabs:
 
 from __future__ import annotations
 
+import codecs
+import io
 import logging
 import os
 import time
 import tkinter as tk
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TextIO
 
 import customtkinter as ctk
 
 from ..api_client import GeminiAPIClient
 from ..config import ConfigManager
-from ..constants import COLORS, FONTS, TOKEN_FACTOR
+from ..constants import COLORS, FONTS, SCAN_CACHE_DIR, TOKEN_FACTOR
 from ..models import (
     ExistingDoc,
     FileInfo,
@@ -40,7 +43,6 @@ from ..token_estimator import (
     CostCalculator,
     CostHistoryManager,
     Currency,
-    ModelRegistry,
 )
 from .event_queue import UIEventQueue
 from .file_tree import OptimizedFileTree
@@ -53,6 +55,27 @@ logger = logging.getLogger(__name__)
 StatusCallback = Callable[[str, str], None]
 ProgressCallback = Callable[[str, int], None]
 
+# Fonts shared by every SetupTab widget, created once a Tk root exists
+_SETUP_FONTS: dict[str, ctk.CTkFont] = {}
+
+
+@lru_cache(maxsize=1024)
+def _format_size(size: int) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        size: Size in bytes.
+
+    Returns:
+        Human-readable size string (B, KB or MB).
+    """
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
 
 class CostHistoryWindow(ctk.CTkToplevel):
     """
@@ -283,15 +306,31 @@ class SetupTab(ctk.CTkFrame):
         """
         super().__init__(master, **kwargs)
 
+        if not _SETUP_FONTS:
+            _SETUP_FONTS.update({
+                "header": ctk.CTkFont(size=FONTS['header'], weight="bold"),
+                "body": ctk.CTkFont(size=FONTS['body']),
+                "body_small": ctk.CTkFont(size=FONTS['body_small']),
+                "small": ctk.CTkFont(size=FONTS['small']),
+                "button": ctk.CTkFont(size=FONTS['button']),
+                "button_bold": ctk.CTkFont(size=FONTS['button'], weight="bold"),
+                "stat_value": ctk.CTkFont(size=20, weight="bold"),
+                "cost_value": ctk.CTkFont(size=18, weight="bold"),
+            })
+
         self.config = config
         self.event_queue = event_queue
         self.api_client = api_client
         self._on_status_update = on_status_update
-        self.scanner = FastFileScanner()
+        self.scanner = FastFileScanner(cache_dir=SCAN_CACHE_DIR)
 
         self._scan_result: Optional[ScanResult] = None
         self._executor = ThreadPoolExecutor(max_workers=2)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
         self._scanning = False
+        self._stats_cache_key: Optional[int] = None
+        self._last_stat_text: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._last_progress: Optional[tuple[str, int]] = None
 
         # Financial Dashboard
         self._current_currency = Currency.EUR
@@ -321,13 +360,13 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             api_header,
             text="\U0001F511 Connessione API",
-            font=ctk.CTkFont(size=FONTS['header'], weight="bold")
+            font=_SETUP_FONTS["header"]
         ).pack(side="left")
 
         self.api_status_badge = ctk.CTkLabel(
             api_header,
             text="\u25CF Non connesso",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         )
         self.api_status_badge.pack(side="right")
@@ -343,7 +382,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             info_box,
             text="\U0001F4A1 Non hai una API Key? Ottienila gratis su: https://makersuite.google.com/app/apikey",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         ).pack(pady=10)
 
@@ -357,7 +396,7 @@ class SetupTab(ctk.CTkFrame):
             show="\u2022",
             width=420,
             height=42,
-            font=ctk.CTkFont(size=FONTS['body'])
+            font=_SETUP_FONTS["body"]
         )
         self.api_key_entry.pack(side="left", padx=(0, 10))
         add_tooltip(
@@ -370,7 +409,7 @@ class SetupTab(ctk.CTkFrame):
             text="\U0001F441",
             width=42,
             height=42,
-            font=ctk.CTkFont(size=FONTS['button']),
+            font=_SETUP_FONTS["button"],
             command=self._toggle_key_visibility
         )
         self.show_key_btn.pack(side="left", padx=(0, 10))
@@ -381,7 +420,7 @@ class SetupTab(ctk.CTkFrame):
             text="\U0001F50C Connetti e Salva",
             width=160,
             height=42,
-            font=ctk.CTkFont(size=FONTS['button'], weight="bold"),
+            font=_SETUP_FONTS["button_bold"],
             fg_color=COLORS['primary'],
             hover_color=COLORS['primary_hover'],
             command=self._connect_api
@@ -397,7 +436,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             project_section,
             text="\U0001F4C2 Progetto da Analizzare",
-            font=ctk.CTkFont(size=FONTS['header'], weight="bold")
+            font=_SETUP_FONTS["header"]
         ).pack(anchor="w", padx=15, pady=(15, 10))
 
         # Path row
@@ -409,7 +448,7 @@ class SetupTab(ctk.CTkFrame):
             placeholder_text="Seleziona la cartella root del progetto... (Ctrl+O)",
             width=520,
             height=42,
-            font=ctk.CTkFont(size=FONTS['body'])
+            font=_SETUP_FONTS["body"]
         )
         self.path_entry.pack(side="left", padx=(0, 10))
         add_tooltip(
@@ -422,7 +461,7 @@ class SetupTab(ctk.CTkFrame):
             text="\U0001F4C1 Sfoglia",
             width=110,
             height=42,
-            font=ctk.CTkFont(size=FONTS['button']),
+            font=_SETUP_FONTS["button"],
             command=self._browse_folder
         )
         browse_btn.pack(side="left", padx=(0, 10))
@@ -433,7 +472,7 @@ class SetupTab(ctk.CTkFrame):
             text="\U0001F50D Scansiona",
             width=140,
             height=42,
-            font=ctk.CTkFont(size=FONTS['button'], weight="bold"),
+            font=_SETUP_FONTS["button_bold"],
             fg_color=COLORS['success'],
             hover_color=COLORS['success_hover'],
             command=self._start_scan
@@ -459,7 +498,7 @@ class SetupTab(ctk.CTkFrame):
         self.progress_label = ctk.CTkLabel(
             self.progress_frame,
             text="",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         )
         self.progress_label.pack(side="left")
@@ -475,49 +514,71 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             stats_header,
             text="\U0001F4CA Statistiche Progetto",
-            font=ctk.CTkFont(size=FONTS['header'], weight="bold")
+            font=_SETUP_FONTS["header"]
         ).pack(side="left")
 
         ctk.CTkLabel(
             stats_header,
             text="Questi dati aiutano a stimare il costo della generazione",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         ).pack(side="right")
 
         stats_grid = ctk.CTkFrame(stats_section, fg_color="transparent")
         stats_grid.pack(fill="x", padx=15, pady=(0, 15))
 
-        self.stat_cards: dict[str, ctk.CTkLabel] = {}
-        stats_config = [
-            ("files", "\U0001F4C4", "File", "--", "Numero di file di codice trovati"),
-            ("dirs", "\U0001F4C1", "Cartelle", "--", "Numero di cartelle"),
-            ("size", "\U0001F4BE", "Dimensione", "--", "Dimensione totale del codice"),
-            ("tokens", "\U0001F3AF", "Token Stimati", "--", "Token stimati per l'AI"),
-            ("context", "\U0001F4CF", "Context Usage", "--", "Percentuale del context window utilizzato")
-        ]
+        self.stat_cards: dict[str, ctk.CTkLabel] = {
+            "files": self._create_stat_card(
+                stats_grid, 0, "\U0001F4C4 File",
+                "Numero di file di codice trovati"
+            ),
+            "dirs": self._create_stat_card(
+                stats_grid, 1, "\U0001F4C1 Cartelle",
+                "Numero di cartelle"
+            ),
+            "size": self._create_stat_card(
+                stats_grid, 2, "\U0001F4BE Dimensione",
+                "Dimensione totale del codice"
+            ),
+            "tokens": self._create_stat_card(
+                stats_grid, 3, "\U0001F3AF Token Stimati",
+                "Token stimati per l'AI"
+            ),
+            "context": self._create_stat_card(
+                stats_grid, 4, "\U0001F4CF Context Usage",
+                "Percentuale del context window utilizzato"
+            ),
+        }
+
+    def _create_stat_card(
+        self,
+        parent: ctk.CTkFrame,
+        column: int,
+        title: str,
+        tooltip_text: str
+    ) -> ctk.CTkLabel:
+        """Create a statistics card widget and return its value label."""
+        card = ctk.CTkFrame(parent, width=155, height=90)
+        card.grid(row=0, column=column, padx=8, pady=5)
+        card.grid_propagate(False)
 
-        for i, (key, icon, label, default, tooltip_text) in enumerate(stats_config):
-            card = ctk.CTkFrame(stats_grid, width=155, height=90)
-            card.grid(row=0, column=i, padx=8, pady=5)
-            card.grid_propagate(False)
+        ctk.CTkLabel(
+            card,
+            text=title,
+            font=_SETUP_FONTS["body_small"],
+            text_color=COLORS['text_muted']
+        ).pack(pady=(14, 4))
 
-            ctk.CTkLabel(
-                card,
-                text=f"{icon} {label}",
-                font=ctk.CTkFont(size=FONTS['body_small']),
-                text_color=COLORS['text_muted']
-            ).pack(pady=(14, 4))
+        value_label = ctk.CTkLabel(
+            card,
+            text="--",
+            font=_SETUP_FONTS["stat_value"]
+        )
+        value_label.pack()
 
-            value_label = ctk.CTkLabel(
-                card,
-                text=default,
-                font=ctk.CTkFont(size=20, weight="bold")
-            )
-            value_label.pack()
+        add_tooltip(card, tooltip_text)
 
-            self.stat_cards[key] = value_label
-            add_tooltip(card, tooltip_text)
+        return value_label
 
     def _create_financial_section(self) -> None:
         """Create financial dashboard section with cost estimation."""
@@ -531,7 +592,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             finance_header,
             text="\U0001F4B0 Financial Dashboard",
-            font=ctk.CTkFont(size=FONTS['header'], weight="bold")
+            font=_SETUP_FONTS["header"]
         ).pack(side="left")
 
         # Currency selector
@@ -541,7 +602,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             currency_frame,
             text="Valuta:",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         ).pack(side="left", padx=(0, 8))
 
@@ -549,7 +610,7 @@ class SetupTab(ctk.CTkFrame):
             currency_frame,
             values=["EUR", "USD"],
             command=self._on_currency_change,
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             width=120
         )
         self.currency_selector.set("EUR")
@@ -599,7 +660,7 @@ class SetupTab(ctk.CTkFrame):
         self.history_btn = ctk.CTkButton(
             history_btn_frame,
             text="\U0001F4C8 Vedi Storico Costi",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             fg_color=COLORS['slate'],
             hover_color="#475569",
             height=32,
@@ -613,7 +674,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             history_btn_frame,
             text="I costi si aggiornano automaticamente quando selezioni/deselezioni file",
-            font=ctk.CTkFont(size=FONTS['small']),
+            font=_SETUP_FONTS["small"],
             text_color=COLORS['text_muted']
         ).pack(side="right")
 
@@ -643,7 +704,7 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             title_frame,
             text=title,
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             text_color=COLORS['text_muted']
         ).pack(side="left")
 
@@ -651,7 +712,7 @@ class SetupTab(ctk.CTkFrame):
         value_label = ctk.CTkLabel(
             card,
             text="--",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_SETUP_FONTS["cost_value"]
         )
         value_label.pack()
 
@@ -659,7 +720,7 @@ class SetupTab(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             card,
             text="",
-            font=ctk.CTkFont(size=FONTS['small']),
+            font=_SETUP_FONTS["small"],
             text_color=COLORS['text_muted']
         )
         subtitle_label.pack()
@@ -685,8 +746,7 @@ class SetupTab(ctk.CTkFrame):
             self.cost_card_savings["subtitle"].configure(text="")
         else:
             # Get current token count
-            included = self.file_tree.get_included_files()
-            total_size = sum(f.size for f in included)
+            total_size = self.file_tree.total_included_size
             tokens = total_size // TOKEN_FACTOR
 
             # Calculate costs for Flash
@@ -762,14 +822,14 @@ class SetupTab(ctk.CTkFrame):
         ctk.CTkLabel(
             tree_header,
             text="\U0001F333 File Trovati",
-            font=ctk.CTkFont(size=FONTS['header'], weight="bold")
+            font=_SETUP_FONTS["header"]
         ).pack(side="left")
 
         # Export context bundle button
         self.export_bundle_btn = ctk.CTkButton(
             tree_header,
             text="\U0001F4E6 Esporta Context Bundle",
-            font=ctk.CTkFont(size=FONTS['body_small']),
+            font=_SETUP_FONTS["body_small"],
             fg_color=COLORS['primary'],
             hover_color="#2563eb",
             height=32,
@@ -881,23 +941,36 @@ class SetupTab(ctk.CTkFrame):
             )
             return
 
+        # Pressing Scan again on the same project is an explicit rescan,
+        # so bypass the cache and walk the tree from scratch
+        root = Path(path)
+        use_cache = (
+            self._scan_result is None or self._scan_result.root_path != root
+        )
+
         self._scanning = True
         self.scan_btn.configure(state="disabled", text="\u23F3 Scansione...")
         self.progress_bar.set(0)
+        self._last_progress = None
 
         def scan_task() -> None:
             self.scanner.set_progress_callback(
-                lambda msg, pct: self.event_queue.put(
-                    self._update_progress, msg, pct
+                lambda msg, pct: self.event_queue.put_latest(
+                    "scan_progress", self._update_progress, msg, pct
                 )
             )
-            result = self.scanner.scan(Path(path))
+            result = (
+                use_cache and self.scanner.load_cached(root)
+            ) or self.scanner.scan(root)
             self.event_queue.put(self._on_scan_complete, result)
 
         self._executor.submit(scan_task)
 
     def _update_progress(self, message: str, percent: int) -> None:
-        """Update progress display."""
+        """Update progress display, skipping repeats of the current state."""
+        if self._last_progress == (message, percent):
+            return
+        self._last_progress = (message, percent)
         self.progress_bar.set(percent / 100)
         self.progress_label.configure(text=message)
 
@@ -906,12 +979,12 @@ class SetupTab(ctk.CTkFrame):
         self._scan_result = result
         self._scanning = False
         self.scan_btn.configure(state="normal", text="\U0001F50D Scansiona")
-        self.progress_bar.set(1)
-        self.progress_label.configure(text="\u2705 Completato!")
+        self._update_progress("\u2705 Completato!", 100)
 
         # Detect existing documentation files
         self.scanner.detect_existing_docs(result)
 
+        self._stats_cache_key = None
         self.file_tree.load_files(result.files)
         self._update_stats()
 
@@ -926,8 +999,16 @@ class SetupTab(ctk.CTkFrame):
         if not self._scan_result:
             return
 
+        # Skip the refresh when the included set is unchanged; a swap of
+        # files can keep the count and size equal, so key on the version
+        cache_key = self.file_tree.selection_version
+        if cache_key == self._stats_cache_key:
+            return
+        self._stats_cache_key = cache_key
+
         included = self.file_tree.get_included_files()
-        total_size = sum(f.size for f in included)
+        total_size = self.file_tree.total_included_size
+
         tokens = total_size // TOKEN_FACTOR
 
         dirs = set()
@@ -936,33 +1017,39 @@ class SetupTab(ctk.CTkFrame):
             if len(parts) > 1:
                 dirs.add(parts[0])
 
-        self.stat_cards["files"].configure(text=str(len(included)))
-        self.stat_cards["dirs"].configure(text=str(len(dirs)))
-
-        if total_size < 1024:
-            size_str = f"{total_size} B"
-        elif total_size < 1024 * 1024:
-            size_str = f"{total_size / 1024:.1f} KB"
-        else:
-            size_str = f"{total_size / (1024 * 1024):.1f} MB"
+        self._set_stat("files", str(len(included)))
+        self._set_stat("dirs", str(len(dirs)))
 
-        self.stat_cards["size"].configure(text=size_str)
-        self.stat_cards["tokens"].configure(text=f"{tokens:,}")
+        self._set_stat("size", _format_size(total_size))
+        self._set_stat("tokens", f"{tokens:,}")
 
         # Calculate context usage percentage
-        model = ModelRegistry.get_model("gemini-1.5-pro")
-        usage = (tokens / model.context_window) * 100 if model.context_window > 0 else 0
+        usage = TokenEstimator.calculate_usage_percentage(tokens, "gemini-1.5-pro")
         if usage < 50:
             color = COLORS['success']
         elif usage < 80:
             color = COLORS['warning']
         else:
             color = COLORS['danger']
-        self.stat_cards["context"].configure(text=f"{usage:.1f}%", text_color=color)
+        self._set_stat("context", f"{usage:.1f}%", text_color=color)
 
         # Update financial dashboard
         self._update_cost_display()
 
+    def _set_stat(self, key: str, text: str, **kwargs: Any) -> None:
+        """
+        Update a stat card label, skipping Tk calls when nothing changed.
+
+        Args:
+            key: Stat card key.
+            text: New label text.
+            **kwargs: Extra label options (e.g. text_color).
+        """
+        if self._last_stat_text.get(key) == (text, kwargs):
+            return
+        self.stat_cards[key].configure(text=text, **kwargs)
+        self._last_stat_text[key] = (text, kwargs)
+
     def get_scan_result(self) -> Optional[ScanResult]:
         """Get the current scan result."""
         return self._scan_result
@@ -975,15 +1062,30 @@ class SetupTab(ctk.CTkFrame):
         self,
         progress_callback: Optional[ProgressCallback] = None
     ) -> None:
-        """Read contents of included files."""
+        """
+        Read contents of included files.
+
+        The file tree updates ``FileInfo.included`` in place on every toggle
+        and shares its file list with the scan result, so the selection is
+        already current here.
+        """
         if self._scan_result:
-            included = self.file_tree.get_included_files()
-            for f in self._scan_result.files:
-                f.included = any(
-                    inc.relative_path == f.relative_path
-                    for inc in included
-                )
-            self.scanner.read_files(self._scan_result, progress_callback)
+            self.scanner.read_files(
+                self._scan_result, progress_callback, self._get_cpu_pool()
+            )
+
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool for CPU-bound reads, creating it on first use."""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor()
+        return self._cpu_pool
+
+    def shutdown(self) -> None:
+        """Release worker pools owned by this tab."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
 
     def _export_context_bundle(self) -> None:
         """Export all selected files as a single context bundle file."""
@@ -1012,10 +1114,7 @@ class SetupTab(ctk.CTkFrame):
             return
 
         try:
-            # Read file contents if not already read
-            self.read_file_contents()
-
-            # Build the bundle content
+            # Build the bundle header
             bundle_parts: list[str] = []
 
             # Header
@@ -1037,40 +1136,39 @@ class SetupTab(ctk.CTkFrame):
             bundle_parts.append("=" * 80)
             bundle_parts.append("")
 
-            # File contents
-            for f in included_files:
-                bundle_parts.append(f"## FILE: {f.relative_path}")
-                bundle_parts.append(f"## Path: {f.path}")
-                bundle_parts.append(f"## Size: {f.size:,} bytes")
-                bundle_parts.append("")
-
-                # Determine language for code block
-                ext = Path(f.relative_path).suffix.lower()
-                lang_map = {
-                    '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
-                    '.jsx': 'jsx', '.tsx': 'tsx', '.java': 'java',
-                    '.c': 'c', '.cpp': 'cpp', '.h': 'c', '.hpp': 'cpp',
-                    '.cs': 'csharp', '.go': 'go', '.rs': 'rust',
-                    '.rb': 'ruby', '.php': 'php', '.swift': 'swift',
-                    '.kt': 'kotlin', '.scala': 'scala', '.r': 'r',
-                    '.sql': 'sql', '.html': 'html', '.css': 'css',
-                    '.scss': 'scss', '.json': 'json', '.xml': 'xml',
-                    '.yaml': 'yaml', '.yml': 'yaml', '.md': 'markdown',
-                    '.sh': 'bash', '.bat': 'batch', '.ps1': 'powershell',
-                }
-                lang = lang_map.get(ext, '')
-
-                bundle_parts.append(f"```{lang}")
-                content = self._scan_result.content_map.get(f.relative_path, "[Content not loaded]")
-                bundle_parts.append(content)
-                bundle_parts.append("```")
-                bundle_parts.append("")
-                bundle_parts.append("-" * 80)
-                bundle_parts.append("")
-
-            # Write to file
-            bundle_content = "\n".join(bundle_parts)
-            Path(save_path).write_text(bundle_content, encoding='utf-8')
+            # File contents are streamed straight into the bundle so memory
+            # stays flat regardless of project size; text mode writes every
+            # line with the platform's line ending
+            with open(save_path, 'w', encoding='utf-8') as out:
+                out.write("\n".join(bundle_parts) + "\n")
+
+                for f in included_files:
+                    # Determine language for code block
+                    ext = Path(f.relative_path).suffix.lower()
+                    lang_map = {
+                        '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
+                        '.jsx': 'jsx', '.tsx': 'tsx', '.java': 'java',
+                        '.c': 'c', '.cpp': 'cpp', '.h': 'c', '.hpp': 'cpp',
+                        '.cs': 'csharp', '.go': 'go', '.rs': 'rust',
+                        '.rb': 'ruby', '.php': 'php', '.swift': 'swift',
+                        '.kt': 'kotlin', '.scala': 'scala', '.r': 'r',
+                        '.sql': 'sql', '.html': 'html', '.css': 'css',
+                        '.scss': 'scss', '.json': 'json', '.xml': 'xml',
+                        '.yaml': 'yaml', '.yml': 'yaml', '.md': 'markdown',
+                        '.sh': 'bash', '.bat': 'batch', '.ps1': 'powershell',
+                    }
+                    lang = lang_map.get(ext, '')
+
+                    file_header = "\n".join([
+                        f"## FILE: {f.relative_path}",
+                        f"## Path: {f.path}",
+                        f"## Size: {f.size:,} bytes",
+                        "",
+                        f"```{lang}",
+                    ])
+                    out.write(file_header + "\n")
+                    self._stream_file_text(f, out)
+                    out.write("\n```\n\n" + "-" * 80 + "\n\n")
 
             self._on_status_update(
                 f"\u2705 Context Bundle salvato: {Path(save_path).name}",
@@ -1081,6 +1179,58 @@ class SetupTab(ctk.CTkFrame):
             logger.error("Failed to export context bundle: %s", e)
             self._on_status_update(f"\u274C Errore esportazione: {e}", "error")
 
+    @staticmethod
+    def _stream_file_text(file_info: FileInfo, out: TextIO) -> None:
+        """
+        Copy a file into a text output stream in fixed-size chunks.
+
+        Files that are not valid UTF-8 are rewound and decoded as latin-1,
+        matching the scanner's decoding fallback. Read errors on either
+        pass leave a placeholder instead of aborting the export.
+
+        Args:
+            file_info: File to copy.
+            out: Text output stream positioned where the content belongs.
+        """
+        start = out.tell()
+        try:
+            try:
+                SetupTab._copy_decoded(file_info, out, 'utf-8-sig')
+            except UnicodeDecodeError:
+                out.seek(start)
+                out.truncate()
+                SetupTab._copy_decoded(file_info, out, 'latin-1')
+        except OSError as e:
+            logger.debug("Error reading %s: %s", file_info.path, e)
+            out.seek(start)
+            out.truncate()
+            out.write("[Content not loaded]")
+
+    @staticmethod
+    def _copy_decoded(file_info: FileInfo, out: TextIO, encoding: str) -> None:
+        """
+        Decode a file chunk by chunk with universal newlines into a stream.
+
+        Like reading the file in text mode, a UTF-8 BOM is dropped and
+        CRLF/CR line endings become ``\\n``, so the output stream applies
+        one consistent line ending.
+
+        Args:
+            file_info: File to copy.
+            out: Text output stream.
+            encoding: Source encoding.
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid in ``encoding``.
+            OSError: If the file cannot be read.
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        for chunk in file_info.content_iter():
+            out.write(decoder.decode(chunk))
+        out.write(decoder.decode(b'', final=True))
+
     def is_api_connected(self) -> bool:
         """Check if API is connected."""
         return "Connesso" in self.api_status_badge.cget("text")
@@ -20,7 +20,8 @@ class ToolTip:
     Tooltip widget that appears on hover.
 
     Displays helpful text when the user hovers over a widget
-    for a specified delay period.
+    for a specified delay period. All tooltips share one hidden
+    Toplevel that is repositioned and relabelled on each show.
 
     Attributes:
         widget: The widget this tooltip is attached to
@@ -28,6 +29,10 @@ class ToolTip:
         delay: Milliseconds to wait before showing tooltip
     """
 
+    _shared_window: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    _active: Optional[ToolTip] = None
+
     def __init__(
         self,
         widget: Any,
@@ -57,10 +62,20 @@ class ToolTip:
         """
         Handle mouse enter event.
 
+        Re-entering while a show is already pending does not reschedule.
+
         Args:
             event: The tkinter event (unused).
         """
-        self.scheduled_id = self.widget.after(self.delay, self._show_tooltip)
+        if self.scheduled_id is not None:
+            return
+
+        self.scheduled_id = self.widget.after(self.delay, self._on_delay_elapsed)
+
+    def _on_delay_elapsed(self) -> None:
+        """Show the tooltip once the hover delay has passed."""
+        self.scheduled_id = None
+        self._show_tooltip()
 
     def _on_leave(self, event: Optional[tk.Event] = None) -> None:
         """
@@ -69,41 +84,63 @@ class ToolTip:
         Args:
             event: The tkinter event (unused).
         """
-        if self.scheduled_id:
+        if self.scheduled_id is not None:
             self.widget.after_cancel(self.scheduled_id)
             self.scheduled_id = None
         self._hide_tooltip()
 
+    @classmethod
+    def _get_shared_window(cls, widget: Any) -> tk.Toplevel:
+        """
+        Get the shared tooltip window, creating it on first use.
+
+        Args:
+            widget: Any widget of the application, used to find the root.
+
+        Returns:
+            The (withdrawn) shared tooltip Toplevel.
+        """
+        tw = cls._shared_window
+        if tw is not None and tw.winfo_exists():
+            return tw
+
+        cls._shared_window = tw = tk.Toplevel(widget._root())
+        tw.withdraw()
+        tw.wm_overrideredirect(True)
+        tw.attributes('-topmost', True)
+
+        frame = tk.Frame(
+            tw,
+            background="#1e293b",
+            borderwidth=1,
+            relief="solid"
+        )
+        frame.pack()
+
+        cls._shared_label = tk.Label(
+            frame,
+            background="#1e293b",
+            foreground="white",
+            font=("Segoe UI", 11),
+            padx=12,
+            pady=8,
+            wraplength=350,
+            justify="left"
+        )
+        cls._shared_label.pack()
+
+        return tw
+
     def _show_tooltip(self) -> None:
         """Display the tooltip window, ensuring it stays within screen bounds."""
-        if self.tooltip_window:
+        if ToolTip._active is self:
             return
 
         try:
-            self.tooltip_window = tw = tk.Toplevel(self.widget)
-            tw.wm_overrideredirect(True)
-            tw.attributes('-topmost', True)
-
-            frame = tk.Frame(
-                tw,
-                background="#1e293b",
-                borderwidth=1,
-                relief="solid"
-            )
-            frame.pack()
-
-            label = tk.Label(
-                frame,
-                text=self.text,
-                background="#1e293b",
-                foreground="white",
-                font=("Segoe UI", 11),
-                padx=12,
-                pady=8,
-                wraplength=350,
-                justify="left"
-            )
-            label.pack()
+            tw = self._get_shared_window(self.widget)
+            ToolTip._shared_label.configure(text=self.text)
+            ToolTip._active = self
+            self.tooltip_window = tw
 
             # Update to get accurate dimensions
             tw.update_idletasks()
@@ -139,17 +176,21 @@ class ToolTip:
             y = max(10, y)
 
             tw.wm_geometry(f"+{x}+{y}")
+            tw.deiconify()
+            tw.lift()
 
         except Exception as e:
             logger.debug("Failed to show tooltip: %s", e)
 
     def _hide_tooltip(self) -> None:
-        """Hide and destroy the tooltip window."""
+        """Hide the shared tooltip window if this tooltip is showing it."""
         if self.tooltip_window:
-            try:
-                self.tooltip_window.destroy()
-            except Exception:
-                pass
+            if ToolTip._active is self:
+                try:
+                    self.tooltip_window.withdraw()
+                except Exception:
+                    pass
+                ToolTip._active = None
             self.tooltip_window = None
 
 
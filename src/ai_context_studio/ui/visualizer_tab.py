@@ -7,24 +7,34 @@ Professional diagram visualization with zoom, pan, and export capabilities.
 
 from __future__ import annotations
 
+import atexit
 import base64
+import html
 import logging
 import re
+import shutil
+import sys
 import tempfile
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import customtkinter as ctk
 
 from ..constants import COLORS, FONTS
+from .event_queue import UIEventQueue
 
 logger = logging.getLogger(__name__)
 
 # Type aliases
 StatusCallback = Callable[[str, str], None]
 
+# Fonts shared by every VisualizerTab widget, created once a Tk root exists
+_VISUALIZER_FONTS: dict[str, ctk.CTkFont] = {}
+
 # Try to import tkinterweb for embedded browser
 try:
     from tkinterweb import HtmlFrame
@@ -42,6 +52,76 @@ except ImportError:
     logger.warning("pywebview not available, export features limited")
 
 
+# Mermaid diagram keywords (lowercase) mapped to display names
+_DIAGRAM_TYPES: dict[str, str] = {
+    'graph': 'Flowchart',
+    'flowchart': 'Flowchart',
+    'sequencediagram': 'Sequence',
+    'classdiagram': 'Class',
+    'statediagram': 'State',
+    'erdiagram': 'ER',
+    'journey': 'Journey',
+    'gantt': 'Gantt',
+    'pie': 'Pie Chart',
+    'gitgraph': 'Git Graph',
+    'mindmap': 'Mind Map',
+    'timeline': 'Timeline',
+    'quadrantchart': 'Quadrant',
+    'sankey': 'Sankey',
+}
+
+# Fenced ```mermaid code blocks in generated documents
+_MERMAID_BLOCK_RE = re.compile(r'```mermaid\s*([\s\S]*?)```')
+
+# Leading diagram keyword, without trailing punctuation such as ';' or ':'
+_DIAGRAM_KEYWORD_RE = re.compile(r'\s*(\w[\w-]*)')
+
+
+def _diagram_keyword(first_line: str) -> str:
+    """
+    Extract the diagram type keyword from a lowercased first line.
+
+    Variant suffixes are dropped, so ``statediagram-v2`` and
+    ``sankey-beta`` resolve to their base keyword. Trailing punctuation
+    is ignored, so ``gitgraph:`` resolves to ``gitgraph``.
+
+    Args:
+        first_line: First meaningful line of the diagram, lowercased.
+
+    Returns:
+        The keyword if it is a known diagram type, else an empty string.
+    """
+    match = _DIAGRAM_KEYWORD_RE.match(first_line)
+    token = match.group(1) if match else ''
+    if token in _DIAGRAM_TYPES:
+        return token
+    base = token.split('-', 1)[0]
+    return base if base in _DIAGRAM_TYPES else ''
+
+
+def _label_quoter(open_br: str, close_br: str) -> Callable[[re.Match], str]:
+    """
+    Build a re.sub callback that quotes a bracketed node label if needed.
+
+    Args:
+        open_br: Opening bracket to emit around the quoted label.
+        close_br: Closing bracket to emit around the quoted label.
+
+    Returns:
+        Callback for a pattern whose group 1 is the label text.
+    """
+    def replace_label(match: re.Match) -> str:
+        content = match.group(1)
+        # Always quote if contains special chars or spaces
+        if MermaidSanitizer._needs_quote(content):
+            # Escape existing quotes
+            content = content.replace('"', "'")
+            return f'{open_br}"{content}"{close_br}'
+        return match.group(0)
+
+    return replace_label
+
+
 class MermaidSanitizer:
     """
     Robust sanitizer for AI-generated Mermaid code.
@@ -66,60 +146,143 @@ class MermaidSanitizer:
         r'^\s*class\s+\w+\s+\w+\s*$',   # class A className
     ]
 
+    # Same characters as SPECIAL_CHARS, for set-based membership tests
+    _SPECIAL_SET: frozenset[str] = frozenset(";:?!@#$%^&*()+=<>|\\'\"`,/~")
+
+    # Precompiled patterns (avoid re-cache lookups in the per-line loop)
+    _STYLE_RES = tuple(re.compile(p, re.IGNORECASE) for p in STYLE_PATTERNS)
+    _STYLE_PREFIXES = ('style', 'linkstyle', 'class')  # 'class' covers classDef
+    _MSG_RE = re.compile(r'([\w]+)([-]+>>?|-->>?)([\w]+):\s*(.+)$')
+    _MSG_PAREN_QUOTE_RE = re.compile(r'\("|"\)')
+    _MSG_TABLE = str.maketrans({'(': '[', ')': ']', '"': None, "'": None})
+    _EDGE_GATE_RE = re.compile(r'--.*--|-..-|==.*==|-->')
+    _PAREN_NODE_RE = re.compile(r'(\w+)\(([^()]+)\)(?!\))')
+    _SUBGRAPH_RE = re.compile(r'^(\s*)subgraph\s+(.+)$', re.IGNORECASE)
+    _BRACKET_MATCH_RE = re.compile(r'(\w+)\s*\[(.+)\]$')
+    _NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+    _BRACKET_PROCESSORS: tuple[tuple[re.Pattern, Callable[[re.Match], str]], ...] = (
+        (re.compile(r'\[([^\[\]"]+)\]'), _label_quoter('[', ']')),        # Square brackets
+        (re.compile(r'\{([^\{\}"]+)\}'), _label_quoter('{', '}')),        # Curly brackets (decisions)
+        # [[...]] needs no pass of its own: the square-bracket pass already
+        # quotes its inner [...] under the same rule
+        (re.compile(r'\(\(([^\(\)"]+)\)\)'), _label_quoter('((', '))')),  # Double parens (circles)
+    )
+    _PIPE_LABEL_RE = re.compile(r'\|([^|]+)\|')
+    # Anything that may need rewriting regardless of labels; see _is_well_formed
+    _FAST_REJECT_RE = re.compile(
+        r'^\s*(?:style|linkstyle|class|subgraph)|[(;]',
+        re.IGNORECASE | re.MULTILINE,
+    )
+    _FAST_PIPE_LABEL_RE = re.compile(r'\|([^|\n]+)\|')
+    _INLINE_LABEL_RE = re.compile(r'(--)\s*([^->|"\s][^->]+?)\s*(-->)')
+    # First line that is neither blank nor a %% comment, minus indentation
+    _FIRST_STATEMENT_RE = re.compile(r'^\s*(?!%%)(\S[^\n]*)', re.MULTILINE)
+    # Group 1 is non-empty for 'subgraph' and empty for 'end'
+    _BLOCK_KEYWORD_RE = re.compile(r'\b(?:(subgraph)|end)\b', re.IGNORECASE)
+
     @classmethod
     def sanitize(cls, code: str) -> str:
         """
         Sanitize Mermaid code to fix common AI-generated issues.
 
+        Results are memoized per code string, so re-rendering the same
+        diagram doesn't repeat the regex work.
+
         Args:
             code: Raw Mermaid code from AI generation
 
         Returns:
             Sanitized Mermaid code that should render correctly
         """
-        if not code or not code.strip():
+        return _sanitize_cached(code)
+
+    @classmethod
+    def _sanitize_code(cls, code: str) -> str:
+        """Uncached implementation of sanitize()."""
+        if not code or not code.strip() or cls._is_well_formed(code):
             return code
 
-        # Detect diagram type
-        first_line = code.strip().split('\n')[0].lower()
+        return '\n'.join(cls.sanitize_lines(code.split('\n')))
+
+    @classmethod
+    def _is_well_formed(cls, code: str) -> bool:
+        """
+        Cheap whole-code check for input that sanitizing leaves unchanged.
+
+        The check is conservative: False only means the full per-line
+        pipeline has to run, never that the code is invalid.
+
+        Args:
+            code: Raw Mermaid code
+
+        Returns:
+            True if no line would be rewritten or dropped
+        """
+        if cls._FAST_REJECT_RE.search(code):
+            return False
+        if 'sequencediagram' in code.lower().replace(' ', ''):
+            return False
+        if cls._INLINE_LABEL_RE.search(code):
+            return False
+        if any(
+            not cls._SPECIAL_SET.isdisjoint(label) and not label.startswith('"')
+            for label in cls._FAST_PIPE_LABEL_RE.findall(code)
+        ):
+            return False
+        return not any(
+            cls._needs_quote(match.group(1))
+            for pattern, _ in cls._BRACKET_PROCESSORS
+            for match in pattern.finditer(code)
+        )
+
+    @classmethod
+    def sanitize_lines(cls, lines: list[str]) -> list[str]:
+        """
+        Sanitize Mermaid code that has already been split into lines.
+
+        Args:
+            lines: Lines of raw Mermaid code
+
+        Returns:
+            Sanitized lines (style directives removed)
+        """
+        # Each line is stripped once; the result is shared by type
+        # detection, the style filter and the line sanitizer
+        stripped_lines = [line.strip() for line in lines]
+
+        # Detect diagram type from the first non-blank line
+        first_line = next((s for s in stripped_lines if s), '').lower()
         is_sequence = 'sequencediagram' in first_line.replace(' ', '')
-        is_flowchart = any(x in first_line for x in ['graph', 'flowchart'])
+        sanitize_line = (
+            cls._sanitize_sequence_line if is_sequence else cls._sanitize_line
+        )
 
-        lines = code.split('\n')
         sanitized_lines = []
-        in_subgraph = False
-
-        for line in lines:
+        for line, stripped in zip(lines, stripped_lines):
             # Skip style directives entirely (they cause parsing issues)
-            if cls._is_style_line(line):
+            if cls._is_style_line(stripped):
                 continue
 
-            if is_sequence:
-                sanitized_line = cls._sanitize_sequence_line(line)
-            else:
-                sanitized_line = cls._sanitize_line(line, in_subgraph)
-            sanitized_lines.append(sanitized_line)
-
-            # Track subgraph state
-            stripped = line.strip().lower()
-            if stripped.startswith('subgraph'):
-                in_subgraph = True
-            elif stripped == 'end':
-                in_subgraph = False
+            sanitized_lines.append(sanitize_line(line, stripped))
 
-        return '\n'.join(sanitized_lines)
+        return sanitized_lines
 
     @classmethod
     def _is_style_line(cls, line: str) -> bool:
         """Check if line is a style directive that should be removed."""
         stripped = line.strip()
-        for pattern in cls.STYLE_PATTERNS:
-            if re.match(pattern, stripped, re.IGNORECASE):
-                return True
-        return False
+        # Cheap prefix test rejects almost every line before any regex runs
+        if not stripped[:9].lower().startswith(cls._STYLE_PREFIXES):
+            return False
+        return any(pattern.match(stripped) for pattern in cls._STYLE_RES)
+
+    @classmethod
+    def _needs_quote(cls, text: str) -> bool:
+        """Check if a label contains spaces or special characters."""
+        return ' ' in text or not cls._SPECIAL_SET.isdisjoint(text)
 
     @classmethod
-    def _sanitize_sequence_line(cls, line: str) -> str:
+    def _sanitize_sequence_line(cls, line: str, stripped: str) -> str:
         """
         Sanitize sequence diagram lines.
 
@@ -127,26 +290,23 @@ class MermaidSanitizer:
         - C-->>A: GenerationResult ("success=True")
         - Parentheses in message text
         """
-        stripped = line.strip()
         if not stripped or stripped.startswith('%%'):
             return line
 
         # Fix sequence messages with problematic characters
         # Pattern: A->>B: Message with (parentheses)
-        message_pattern = r'([\w]+)([-]+>>?|-->>?)([\w]+):\s*(.+)$'
-        match = re.match(message_pattern, stripped)
+        match = cls._MSG_RE.match(stripped)
         if match:
             sender = match.group(1)
             arrow = match.group(2)
             receiver = match.group(3)
             message = match.group(4)
 
-            # Clean up message - remove or escape problematic chars
-            message = message.replace('("', ' - ')
-            message = message.replace('")', '')
-            message = message.replace('(', '[')
-            message = message.replace(')', ']')
-            message = re.sub(r'["\']', '', message)
+            # Clean up message - remove or escape problematic chars:
+            # ("x") becomes " - x", then parens -> brackets, quotes dropped
+            message = cls._MSG_PAREN_QUOTE_RE.sub(
+                lambda m: ' - ' if m.group() == '("' else '', message
+            ).translate(cls._MSG_TABLE)
 
             indent = len(line) - len(line.lstrip())
             return ' ' * indent + f'{sender}{arrow}{receiver}: {message}'
@@ -154,9 +314,8 @@ class MermaidSanitizer:
         return line
 
     @classmethod
-    def _sanitize_line(cls, line: str, in_subgraph: bool) -> str:
+    def _sanitize_line(cls, line: str, stripped: str) -> str:
         """Sanitize a single line of flowchart/graph code."""
-        stripped = line.strip()
         if not stripped or stripped.startswith('%%'):
             return line
 
@@ -167,12 +326,19 @@ class MermaidSanitizer:
         # Uniformize node brackets - convert () to [] for consistency
         result = cls._uniformize_node_brackets(line)
 
-        # Handle node definitions with labels
-        if re.search(r'\[.*\]|\{.*\}|\(\(.*\)\)|\[\[.*\]\]', result):
+        # Handle node definitions with labels: an opening bracket before
+        # the last matching closing one ([...], {...} or ((...)))
+        if (-1 < result.find('[') < result.rfind(']')
+                or -1 < result.find('{') < result.rfind('}')
+                or -1 < result.find('((') < result.rfind('))') - 1):
             result = cls._sanitize_node_labels(result)
 
-        # Handle edge labels
-        if re.search(r'--.*--|-..-|==.*==|-->', result):
+        # Handle edge labels. Only |label| rewriting depends on the edge
+        # pattern; the inline -- label --> form needs '--' to match at all
+        if '|' in result:
+            if cls._EDGE_GATE_RE.search(result):
+                result = cls._sanitize_edge_labels(result)
+        elif '--' in result:
             result = cls._sanitize_edge_labels(result)
 
         return result
@@ -187,25 +353,20 @@ class MermaidSanitizer:
 
         Keeps {} for decision nodes and (()) for circles.
         """
+        # Most lines (plain edges, quoted labels) have no parens at all
+        if '(' not in line:
+            return line
+
         # Pattern to match single-paren nodes that should be []
         # But NOT decision nodes {} or special shapes (()) [[]]
         def replace_paren_node(match):
             before = match.group(1)
-            content = match.group(2)
-            after = match.group(3)
-
-            # If content has special meaning (decision, etc), keep as is
-            # Otherwise convert to square brackets
-            return f'{before}["{content}"]{after}'
+            # Drop existing quotes so A("text") doesn't become A[""text""]
+            content = match.group(2).strip('"')
+            return f'{before}["{content}"]'
 
         # Match A("content") or A(content) but not A((content)) or A{content}
-        result = re.sub(
-            r'(\w+)\(([^()]+)\)(?!\))',
-            replace_paren_node,
-            line
-        )
-
-        return result
+        return cls._PAREN_NODE_RE.sub(replace_paren_node, line)
 
     @classmethod
     def _sanitize_subgraph(cls, line: str) -> str:
@@ -215,7 +376,7 @@ class MermaidSanitizer:
         Converts: subgraph Livello 1: Foundation
         To:       subgraph sg1["Livello 1: Foundation"]
         """
-        match = re.match(r'^(\s*)subgraph\s+(.+)$', line, re.IGNORECASE)
+        match = cls._SUBGRAPH_RE.match(line)
         if not match:
             return line
 
@@ -223,16 +384,16 @@ class MermaidSanitizer:
         name = match.group(2).strip()
 
         # If already in bracket format, sanitize the content
-        bracket_match = re.match(r'(\w+)\s*\[(.+)\]$', name)
+        bracket_match = cls._BRACKET_MATCH_RE.match(name)
         if bracket_match:
             sub_id = bracket_match.group(1)
             sub_name = bracket_match.group(2).strip('"')
             return f'{indent}subgraph {sub_id}["{sub_name}"]'
 
         # Check if name has problematic characters or spaces
-        if re.search(cls.SPECIAL_CHARS, name) or ' ' in name:
+        if cls._needs_quote(name):
             # Generate a safe ID from the name
-            safe_id = 'sg' + re.sub(r'[^a-zA-Z0-9]', '', name)[:8]
+            safe_id = 'sg' + cls._NON_ALNUM_RE.sub('', name)[:8]
             if not safe_id or safe_id == 'sg':
                 safe_id = 'subg'
             return f'{indent}subgraph {safe_id}["{name}"]'
@@ -249,28 +410,13 @@ class MermaidSanitizer:
         """
         result = line
 
-        # Pattern for different bracket types
-        bracket_patterns = [
-            (r'\[([^\[\]"]+)\]', '[', ']'),       # Square brackets
-            (r'\{([^\{\}"]+)\}', '{', '}'),       # Curly brackets (decisions)
-            (r'\[\[([^\[\]"]+)\]\]', '[[', ']]'), # Double square
-            (r'\(\(([^\(\)"]+)\)\)', '((', '))'), # Double parens (circles)
-        ]
-
-        for pattern, open_br, close_br in bracket_patterns:
-            def replace_label(match, ob=open_br, cb=close_br):
-                content = match.group(1)
-                # Always quote if contains special chars or spaces
-                if re.search(cls.SPECIAL_CHARS, content) or ' ' in content:
-                    # Escape existing quotes
-                    content = content.replace('"', "'")
-                    return f'{ob}"{content}"{cb}'
-                return match.group(0)
-
-            result = re.sub(pattern, replace_label, result)
-
-        # Remove trailing semicolons (common AI mistake)
-        result = re.sub(r';\s*$', '', result)
+        for pattern, replace_label in cls._BRACKET_PROCESSORS:
+            result = pattern.sub(replace_label, result)
+
+        # Remove a trailing semicolon (common AI mistake)
+        trimmed = result.rstrip()
+        if trimmed.endswith(';'):
+            result = trimmed[:-1]
 
         return result
 
@@ -287,12 +433,12 @@ class MermaidSanitizer:
         # Handle |label| format - quote if needed
         def quote_pipe_label(match):
             label = match.group(1)
-            if re.search(cls.SPECIAL_CHARS, label) and not label.startswith('"'):
+            if not cls._SPECIAL_SET.isdisjoint(label) and not label.startswith('"'):
                 label = label.replace('"', "'")
                 return f'|"{label}"|'
             return match.group(0)
 
-        result = re.sub(r'\|([^|]+)\|', quote_pipe_label, result)
+        result = cls._PIPE_LABEL_RE.sub(quote_pipe_label, result)
 
         # Handle -- label --> format (convert to pipe format)
         def convert_inline_label(match):
@@ -305,7 +451,7 @@ class MermaidSanitizer:
                 return f'-->|"{label}"|'
             return match.group(0)
 
-        result = re.sub(r'(--)\s*([^->|"\s][^->]+?)\s*(-->)', convert_inline_label, result)
+        result = cls._INLINE_LABEL_RE.sub(convert_inline_label, result)
 
         return result
 
@@ -314,24 +460,27 @@ class MermaidSanitizer:
         """
         Basic validation of Mermaid code structure.
 
+        Results are memoized per code string.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return _validate_cached(code)
+
+    @classmethod
+    def _validate_code(cls, code: str) -> tuple[bool, str]:
+        """Uncached implementation of validate()."""
         if not code or not code.strip():
             return False, "Codice vuoto"
 
-        lines = [l.strip() for l in code.split('\n') if l.strip() and not l.strip().startswith('%%')]
-
-        if not lines:
+        # Only the first meaningful line is needed; find it without splitting
+        match = cls._FIRST_STATEMENT_RE.search(code)
+        if match is None:
             return False, "Nessuna istruzione valida"
+        first_line = match.group(1).rstrip().lower()
 
         # Check for valid diagram type
-        first_line = lines[0].lower()
-        valid_types = ['graph', 'flowchart', 'sequencediagram', 'classdiagram',
-                       'statediagram', 'erdiagram', 'journey', 'gantt', 'pie',
-                       'gitgraph', 'mindmap', 'timeline', 'quadrantchart', 'sankey']
-
-        if not any(vt in first_line for vt in valid_types):
+        if not _diagram_keyword(first_line):
             return False, f"Tipo diagramma non riconosciuto: {first_line[:50]}"
 
         # Check bracket balance
@@ -340,141 +489,692 @@ class MermaidSanitizer:
         if open_count != close_count:
             return False, f"Parentesi non bilanciate: {open_count} aperte, {close_count} chiuse"
 
-        # Check subgraph/end balance
-        subgraph_count = len(re.findall(r'\bsubgraph\b', code, re.IGNORECASE))
-        end_count = len(re.findall(r'\bend\b', code, re.IGNORECASE))
+        # Check subgraph/end balance (one scan counts both keywords)
+        subgraph_count = end_count = 0
+        for is_subgraph in cls._BLOCK_KEYWORD_RE.findall(code):
+            if is_subgraph:
+                subgraph_count += 1
+            else:
+                end_count += 1
         if subgraph_count != end_count:
             return False, f"Subgraph/end non bilanciati: {subgraph_count} subgraph, {end_count} end"
 
         return True, ""
 
 
+@lru_cache(maxsize=256)
+def _sanitize_cached(code: str) -> str:
+    """Memoized MermaidSanitizer._sanitize_code."""
+    return MermaidSanitizer._sanitize_code(code)
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(code: str) -> tuple[bool, str]:
+    """Memoized MermaidSanitizer._validate_code."""
+    return MermaidSanitizer._validate_code(code)
+
+
 class MermaidDiagram:
     """Represents a single Mermaid diagram."""
 
     def __init__(self, code: str, source_file: str, index: int):
         self.raw_code = code.strip()
-        self.code = MermaidSanitizer.sanitize(self.raw_code)
+        # Interned so identical diagrams share one string and cache lookups
+        # keyed on the code (validation, rendered HTML) hit on identity
+        self.code = sys.intern(MermaidSanitizer.sanitize(self.raw_code))
         self.source_file = source_file
         self.index = index
         self.diagram_type = self._detect_type()
         self.is_valid, self.validation_error = MermaidSanitizer.validate(self.code)
+        # (position, HTML) of the last browser-page card built for this diagram
+        self._card_html: Optional[tuple[int, str]] = None
 
     def _detect_type(self) -> str:
         """Detect the diagram type from code."""
-        first_line = self.code.split('\n')[0].strip().lower()
-        type_map = {
-            'graph': 'Flowchart',
-            'flowchart': 'Flowchart',
-            'sequencediagram': 'Sequence',
-            'classdiagram': 'Class',
-            'statediagram': 'State',
-            'erdiagram': 'ER',
-            'journey': 'Journey',
-            'gantt': 'Gantt',
-            'pie': 'Pie Chart',
-            'gitgraph': 'Git Graph',
-            'mindmap': 'Mind Map',
-            'timeline': 'Timeline',
-            'quadrantchart': 'Quadrant',
-            'sankey': 'Sankey',
-        }
-        for key, value in type_map.items():
-            if key in first_line:
-                return value
-        return 'Diagram'
-
-
-class VisualizerTab(ctk.CTkFrame):
-    """
-    Professional Mermaid diagram visualizer tab.
-
-    Features:
-    - Embedded HTML rendering with Mermaid.js
-    - Zoom and pan controls
-    - Export to PNG/SVG
-    - Light/Dark theme support
-    - Diagram list with quick navigation
-    """
-
-    def __init__(
-        self,
-        master: Any,
-        on_status_update: StatusCallback,
-        **kwargs: Any
-    ) -> None:
-        """Initialize the visualizer tab."""
-        super().__init__(master, **kwargs)
-
-        self._on_status_update = on_status_update
-        self._diagrams: list[MermaidDiagram] = []
-        self._current_diagram: Optional[MermaidDiagram] = None
-        self._zoom_level: float = 1.0
-        self._theme: str = "default"  # default, dark, forest, neutral
-        self._temp_html_path: Optional[Path] = None
-
-        self._setup_ui()
+        first_line = self.code.partition('\n')[0].strip().lower()
+        return _DIAGRAM_TYPES.get(_diagram_keyword(first_line), 'Diagram')
 
-    def _setup_ui(self) -> None:
-        """Set up the tab UI."""
-        # Configure grid
-        self.grid_columnconfigure(1, weight=1)
-        self.grid_rowconfigure(0, weight=1)
 
-        # Left sidebar - diagram list
-        self._create_sidebar()
+# Page template for a single rendered diagram; filled with format_map()
+_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html, body {{
+            width: 100%;
+            height: 100%;
+            overflow: auto;
+            background: {bg};
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        }}
+        #container {{
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100%;
+            padding: 20px;
+            transform-origin: center center;
+            transform: scale({zoom});
+        }}
+        .mermaid {{
+            background: transparent;
+        }}
+        .mermaid svg {{
+            max-width: none !important;
+        }}
+        #error-container {{
+            display: none;
+            padding: 30px;
+            max-width: 800px;
+            margin: 20px auto;
+        }}
+        .error-box {{
+            background: {err_bg};
+            border: 2px solid {err_border};
+            border-radius: 12px;
+            padding: 20px;
+            margin-bottom: 20px;
+        }}
+        .error-title {{
+            color: {err_title};
+            font-size: 18px;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }}
+        .error-message {{
+            color: {err_msg_color};
+            font-size: 14px;
+            margin-bottom: 15px;
+        }}
+        .code-fallback {{
+            background: {code_bg};
+            color: #e2e8f0;
+            padding: 15px;
+            border-radius: 8px;
+            overflow-x: auto;
+            font-family: 'Consolas', 'Monaco', monospace;
+            font-size: 12px;
+            white-space: pre-wrap;
+            word-break: break-word;
+        }}
+        .help-text {{
+            color: {help_color};
+            font-size: 13px;
+            margin-top: 15px;
+        }}
+        .help-text a {{
+            color: #3b82f6;
+        }}
+    </style>
+</head>
+<body>
+    <div id="container">
+        <pre class="mermaid" id="mermaid-diagram">
+{diagram}
+        </pre>
+    </div>
 
-        # Main content - viewer
-        self._create_viewer()
+    <div id="error-container">
+        <div class="error-box">
+            <div class="error-title">Errore nel rendering del diagramma</div>
+            <div class="error-message" id="error-message"></div>
+            <p class="help-text">
+                Il diagramma contiene sintassi non valida per Mermaid.
+                <a href="https://mermaid.js.org/syntax/flowchart.html" target="_blank">
+                    Consulta la documentazione Mermaid
+                </a>
+            </p>
+        </div>
+        <h4 style="color: {h4_color}; margin-bottom: 10px;">
+            Codice sorgente:
+        </h4>
+        <pre class="code-fallback">{escaped}</pre>
+    </div>
 
-    def _create_sidebar(self) -> None:
-        """Create the diagram list sidebar."""
-        sidebar = ctk.CTkFrame(self, width=280, fg_color="#f8fafc")
-        sidebar.grid(row=0, column=0, sticky="nsw", padx=(15, 0), pady=15)
-        sidebar.grid_propagate(False)
+    <script>
+        window.setZoom = function (z) {{
+            document.getElementById('container').style.transform = 'scale(' + z + ')';
+        }};
 
-        # Header
-        header = ctk.CTkFrame(sidebar, fg_color="transparent")
-        header.pack(fill="x", padx=15, pady=(15, 10))
+        mermaid.initialize({{
+            startOnLoad: false,
+            theme: '{theme}',
+            securityLevel: 'loose',
+            flowchart: {{
+                useMaxWidth: false,
+                htmlLabels: true,
+                curve: 'basis'
+            }},
+            sequence: {{
+                useMaxWidth: false
+            }},
+            logLevel: 'error'
+        }});
 
-        ctk.CTkLabel(
-            header,
-            text="Diagrammi",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#1e293b"
-        ).pack(side="left")
+        async function renderDiagram() {{
+            const element = document.getElementById('mermaid-diagram');
+            const container = document.getElementById('container');
+            const errorContainer = document.getElementById('error-container');
 
-        self.diagram_count = ctk.CTkLabel(
-            header,
-            text="0",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS['text_muted'],
-            fg_color=COLORS['primary'],
-            corner_radius=10,
-            width=30,
-            height=24
-        )
-        self.diagram_count.pack(side="right")
+            try {{
+                const {{ svg }} = await mermaid.render('diagram-svg', element.textContent);
+                element.innerHTML = svg;
+            }} catch (error) {{
+                console.error('Mermaid error:', error);
+                container.style.display = 'none';
+                errorContainer.style.display = 'block';
+                document.getElementById('error-message').textContent =
+                    error.message || 'Errore di sintassi nel codice Mermaid';
+            }}
+        }}
 
-        # Refresh button
-        ctk.CTkButton(
-            sidebar,
-            text="Aggiorna da Documenti",
-            font=ctk.CTkFont(size=11),
-            fg_color=COLORS['primary'],
-            hover_color=COLORS['primary_hover'],
-            height=32,
-            command=self._refresh_from_preview
-        ).pack(fill="x", padx=15, pady=(0, 10))
+        renderDiagram();
+    </script>
+</body>
+</html>'''
 
-        # Theme selector
+# Colours substituted into _HTML_TEMPLATE for light and dark Mermaid themes
+_LIGHT_THEME_VARS: dict[str, str] = {
+    'bg': '#ffffff',
+    'err_bg': '#fef2f2',
+    'err_border': '#fecaca',
+    'err_title': '#dc2626',
+    'err_msg_color': '#b91c1c',
+    'code_bg': '#1e293b',
+    'help_color': '#64748b',
+    'h4_color': '#1e293b',
+}
+_DARK_THEME_VARS: dict[str, str] = {
+    'bg': '#1e293b',
+    'err_bg': '#2d1b1b',
+    'err_border': '#7f1d1d',
+    'err_title': '#fca5a5',
+    'err_msg_color': '#fca5a5',
+    'code_bg': '#0f172a',
+    'help_color': '#94a3b8',
+    'h4_color': '#e2e8f0',
+}
+
+# Theme combo labels mapped to Mermaid theme names
+_THEME_MAP: dict[str, str] = {
+    "Default": "default",
+    "Dark": "dark",
+    "Forest": "forest",
+    "Neutral": "neutral"
+}
+
+# Diagram list row (frame color, status icon, text color) by validity
+_ROW_STYLES: dict[bool, tuple[str, str, str]] = {
+    True: ("white", "", "#1e293b"),
+    False: ("#fefce8", " ", "#b45309"),  # Light yellow for warnings
+}
+
+# Info bar (text suffix, text color) by validity
+_INFO_STYLES: dict[bool, tuple[str, str]] = {
+    True: ("", COLORS['text_muted']),
+    False: (" (Possibile errore di sintassi)", "#b45309"),
+}
+
+# Page template for the all-diagrams browser view; filled with format_map()
+_BROWSER_TEMPLATE = '''<!DOCTYPE html>
+<html lang="it">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Mermaid Visualizer - AI Context Studio</title>
+    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: {page_bg};
+            color: {text};
+            min-height: 100vh;
+            padding: 40px 20px;
+        }}
+        .container {{
+            max-width: 1400px;
+            margin: 0 auto;
+        }}
+        header {{
+            text-align: center;
+            margin-bottom: 40px;
+        }}
+        h1 {{
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+            background: linear-gradient(135deg, #3b82f6, #8b5cf6);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        .subtitle {{
+            color: {muted};
+        }}
+        .controls {{
+            display: flex;
+            justify-content: center;
+            gap: 15px;
+            margin-bottom: 30px;
+            flex-wrap: wrap;
+        }}
+        .controls button {{
+            padding: 10px 20px;
+            border: none;
+            border-radius: 8px;
+            cursor: pointer;
+            font-size: 14px;
+            transition: transform 0.2s;
+        }}
+        .controls button:hover {{
+            transform: translateY(-2px);
+        }}
+        .btn-primary {{
+            background: #3b82f6;
+            color: white;
+        }}
+        .diagram-card {{
+            background: {card_bg};
+            border-radius: 16px;
+            padding: 30px;
+            margin-bottom: 30px;
+            box-shadow: 0 10px 40px rgba(0,0,0,{shadow_alpha});
+        }}
+        .diagram-header {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 20px;
+            padding-bottom: 15px;
+            border-bottom: 2px solid {border};
+        }}
+        .diagram-header h3 {{
+            font-size: 1.25rem;
+        }}
+        .source {{
+            color: {muted};
+            font-size: 0.9rem;
+        }}
+        .diagram-content {{
+            display: flex;
+            justify-content: center;
+            padding: 30px;
+            background: {content_bg};
+            border-radius: 12px;
+            margin-bottom: 20px;
+            overflow: auto;
+        }}
+        .diagram-actions {{
+            display: flex;
+            gap: 10px;
+            margin-bottom: 15px;
+        }}
+        .diagram-actions button {{
+            padding: 8px 16px;
+            border: none;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 13px;
+            background: {border};
+            color: {text};
+        }}
+        .diagram-actions button:hover {{
+            background: {button_hover};
+        }}
+        details {{
+            margin-top: 15px;
+        }}
+        summary {{
+            cursor: pointer;
+            color: #3b82f6;
+            font-weight: 500;
+        }}
+        .code-block {{
+            background: {code_bg};
+            color: #e2e8f0;
+            padding: 15px;
+            border-radius: 8px;
+            margin-top: 10px;
+            overflow-x: auto;
+            font-family: 'Consolas', monospace;
+            font-size: 13px;
+        }}
+        .mermaid svg {{
+            max-width: none !important;
+        }}
+        .has-warning {{
+            border-left: 4px solid #f59e0b;
+        }}
+        .warning-badge {{
+            background: #fef3c7;
+            color: #b45309;
+            padding: 2px 8px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: normal;
+            margin-left: 10px;
+        }}
+        .error-fallback {{
+            background: {err_bg};
+            border: 2px solid {err_border};
+            border-radius: 8px;
+            padding: 20px;
+        }}
+        .error-message {{
+            color: {err_text};
+            margin-bottom: 15px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>Mermaid Visualizer</h1>
+            <p class="subtitle">AI Context Studio - {count} diagrammi</p>
+        </header>
+
+        <div class="controls">
+            <button class="btn-primary" onclick="window.print()">Stampa / Salva PDF</button>
+        </div>
+
+        {diagrams_html}
+    </div>
+
+    <script>
+        mermaid.initialize({{
+            startOnLoad: false,
+            theme: '{theme}',
+            securityLevel: 'loose',
+            flowchart: {{ useMaxWidth: false, htmlLabels: true }},
+            sequence: {{ useMaxWidth: false }},
+            logLevel: 'error'
+        }});
+
+        // Diagram sources are embedded as base64-encoded UTF-8
+        function decodeSource(encoded) {{
+            const bytes = Uint8Array.from(atob(encoded), c => c.charCodeAt(0));
+            return new TextDecoder().decode(bytes);
+        }}
+
+        // Render each diagram individually to handle errors gracefully
+        async function renderAllDiagrams() {{
+            const diagrams = document.querySelectorAll('.mermaid');
+
+            for (let i = 0; i < diagrams.length; i++) {{
+                const element = diagrams[i];
+                const index = element.id.replace('mermaid-', '');
+                const content = document.getElementById('content-' + index);
+                const errorDiv = document.getElementById('error-' + index);
+                const errorMsg = document.getElementById('error-msg-' + index);
+
+                try {{
+                    const code = decodeSource(element.dataset.src);
+                    const {{ svg }} = await mermaid.render('svg-' + index, code.trim());
+                    element.innerHTML = svg;
+                }} catch (error) {{
+                    console.error('Mermaid error for diagram ' + index + ':', error);
+                    content.style.display = 'none';
+                    errorDiv.style.display = 'block';
+                    errorMsg.textContent = error.message || 'Errore di sintassi';
+                }}
+            }}
+        }}
+
+        renderAllDiagrams();
+
+        function copyCode(index) {{
+            const code = document.getElementById('code-' + index).textContent;
+            navigator.clipboard.writeText(code).then(() => {{
+                alert('Codice copiato!');
+            }});
+        }}
+
+        function downloadSVG(index) {{
+            const container = document.querySelector('#diagram-' + index + ' .diagram-content');
+            const svg = container.querySelector('svg');
+            if (svg) {{
+                const svgData = new XMLSerializer().serializeToString(svg);
+                const blob = new Blob([svgData], {{type: 'image/svg+xml'}});
+                const url = URL.createObjectURL(blob);
+                const a = document.createElement('a');
+                a.href = url;
+                a.download = 'diagram-' + index + '.svg';
+                a.click();
+                URL.revokeObjectURL(url);
+            }} else {{
+                alert('Impossibile scaricare: il diagramma non è stato renderizzato correttamente');
+            }}
+        }}
+    </script>
+</body>
+</html>'''
+
+# Page halves around the cards, so the page can be written piece by piece
+_BROWSER_HEAD, _BROWSER_TAIL = _BROWSER_TEMPLATE.split('{diagrams_html}')
+
+# Colours substituted into _BROWSER_TEMPLATE for light and dark themes
+_BROWSER_LIGHT_VARS: dict[str, str] = {
+    'page_bg': 'linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%)',
+    'text': '#1e293b',
+    'muted': '#64748b',
+    'card_bg': 'white',
+    'shadow_alpha': '0.1',
+    'border': '#e2e8f0',
+    'content_bg': '#f8fafc',
+    'button_hover': '#cbd5e1',
+    'code_bg': '#1e293b',
+    'err_bg': '#fef2f2',
+    'err_border': '#fecaca',
+    'err_text': '#dc2626',
+}
+_BROWSER_DARK_VARS: dict[str, str] = {
+    'page_bg': '#0f172a',
+    'text': '#e2e8f0',
+    'muted': '#94a3b8',
+    'card_bg': '#1e293b',
+    'shadow_alpha': '0.3',
+    'border': '#334155',
+    'content_bg': '#0f172a',
+    'button_hover': '#475569',
+    'code_bg': '#0f172a',
+    'err_bg': '#2d1b1b',
+    'err_border': '#7f1d1d',
+    'err_text': '#fca5a5',
+}
+
+
+@lru_cache(maxsize=64)
+def _mermaid_page(code: str, theme: str, zoom: float) -> str:
+    """Format _HTML_TEMPLATE for a diagram at a theme and zoom level."""
+    template_vars = dict(
+        _DARK_THEME_VARS if theme == "dark" else _LIGHT_THEME_VARS
+    )
+    template_vars.update(
+        theme=theme,
+        zoom=zoom,
+        diagram=code,
+        # HTML escaped for display in error fallback
+        escaped=html.escape(code, quote=True),
+    )
+    return _HTML_TEMPLATE.format_map(template_vars)
+
+
+def _diagram_card(diagram: MermaidDiagram, i: int) -> str:
+    """
+    Build the browser-page card for a diagram shown at position i.
+
+    The card depends only on the diagram and its position, so it is kept
+    on the diagram and reused when the page is regenerated (e.g. after a
+    theme change).
+
+    Args:
+        diagram: Diagram to render.
+        i: Position of the diagram on the page, used in element ids.
+
+    Returns:
+        HTML fragment for the card.
+    """
+    if diagram._card_html is not None and diagram._card_html[0] == i:
+        return diagram._card_html[1]
+
+    # Escape code for HTML display
+    html_escaped_code = html.escape(diagram.code, quote=True)
+    # Source for Mermaid, decoded by the page script; base64 needs no escaping
+    encoded_code = base64.b64encode(diagram.code.encode('utf-8')).decode('ascii')
+
+    # Status indicator
+    status_class = "" if diagram.is_valid else "has-warning"
+    status_badge = "" if diagram.is_valid else '<span class="warning-badge">Possibile errore</span>'
+
+    card = f'''
+            <div class="diagram-card {status_class}" id="diagram-{i}">
+                <div class="diagram-header">
+                    <h3>{diagram.diagram_type} #{diagram.index} {status_badge}</h3>
+                    <span class="source">Da: {diagram.source_file}</span>
+                </div>
+                <div class="diagram-content" id="content-{i}">
+                    <pre class="mermaid" id="mermaid-{i}" data-src="{encoded_code}"></pre>
+                </div>
+                <div class="error-fallback" id="error-{i}" style="display:none;">
+                    <div class="error-message">
+                        <strong>Errore di rendering:</strong>
+                        <span id="error-msg-{i}"></span>
+                    </div>
+                    <pre class="code-block">{html_escaped_code}</pre>
+                </div>
+                <div class="diagram-actions">
+                    <button onclick="copyCode({i})">Copia Codice</button>
+                    <button onclick="downloadSVG({i})">Scarica SVG</button>
+                </div>
+                <details>
+                    <summary>Mostra codice sorgente</summary>
+                    <pre class="code-block"><code id="code-{i}">{html_escaped_code}</code></pre>
+                </details>
+            </div>
+            '''
+
+    diagram._card_html = (i, card)
+    return card
+
+
+class VisualizerTab(ctk.CTkFrame):
+    """
+    Professional Mermaid diagram visualizer tab.
+
+    Features:
+    - Embedded HTML rendering with Mermaid.js
+    - Zoom and pan controls
+    - Export to PNG/SVG
+    - Light/Dark theme support
+    - Diagram list with quick navigation
+    """
+
+    # Zoom/theme changes closer together than this (ms) share one reload
+    RENDER_DEBOUNCE_MS = 80
+
+    def __init__(
+        self,
+        master: Any,
+        event_queue: UIEventQueue,
+        on_status_update: StatusCallback,
+        **kwargs: Any
+    ) -> None:
+        """Initialize the visualizer tab."""
+        super().__init__(master, **kwargs)
+
+        if not _VISUALIZER_FONTS:
+            _VISUALIZER_FONTS.update({
+                "header": ctk.CTkFont(size=16, weight="bold"),
+                "body": ctk.CTkFont(size=12),
+                "body_bold": ctk.CTkFont(size=12, weight="bold"),
+                "small": ctk.CTkFont(size=11),
+                "caption": ctk.CTkFont(size=10),
+                "tiny": ctk.CTkFont(size=9),
+                "code": ctk.CTkFont(family="Consolas", size=12),
+            })
+
+        self.event_queue = event_queue
+        self._on_status_update = on_status_update
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Bumped per refresh so results of superseded refreshes are dropped
+        self._refresh_seq: int = 0
+        self._diagrams: list[MermaidDiagram] = []
+        self._current_diagram: Optional[MermaidDiagram] = None
+        self._zoom_level: float = 1.0
+        self._theme: str = "default"  # default, dark, forest, neutral
+        self._render_after_id: Optional[str] = None
+        self._temp_html_path: Optional[Path] = None
+        # Diagram list widgets, recycled across refreshes
+        self._row_pool: list[dict[str, Any]] = []
+        self._summary_frame: Optional[ctk.CTkFrame] = None
+        self._summary_label: Optional[ctk.CTkLabel] = None
+        self._summary_count: int = 0  # Count shown by _summary_label
+        self._invalid_count: int = 0
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """Set up the tab UI."""
+        # Configure grid
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        # Left sidebar - diagram list
+        self._create_sidebar()
+
+        # Main content - viewer
+        self._create_viewer()
+
+    def _create_sidebar(self) -> None:
+        """Create the diagram list sidebar."""
+        sidebar = ctk.CTkFrame(self, width=280, fg_color="#f8fafc")
+        sidebar.grid(row=0, column=0, sticky="nsw", padx=(15, 0), pady=15)
+        sidebar.grid_propagate(False)
+
+        # Header
+        header = ctk.CTkFrame(sidebar, fg_color="transparent")
+        header.pack(fill="x", padx=15, pady=(15, 10))
+
+        ctk.CTkLabel(
+            header,
+            text="Diagrammi",
+            font=_VISUALIZER_FONTS["header"],
+            text_color="#1e293b"
+        ).pack(side="left")
+
+        self.diagram_count = ctk.CTkLabel(
+            header,
+            text="0",
+            font=_VISUALIZER_FONTS["body"],
+            text_color=COLORS['text_muted'],
+            fg_color=COLORS['primary'],
+            corner_radius=10,
+            width=30,
+            height=24
+        )
+        self.diagram_count.pack(side="right")
+
+        # Refresh button
+        ctk.CTkButton(
+            sidebar,
+            text="Aggiorna da Documenti",
+            font=_VISUALIZER_FONTS["small"],
+            fg_color=COLORS['primary'],
+            hover_color=COLORS['primary_hover'],
+            height=32,
+            command=self._refresh_from_preview
+        ).pack(fill="x", padx=15, pady=(0, 10))
+
+        # Theme selector
         theme_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
         theme_frame.pack(fill="x", padx=15, pady=(0, 10))
 
         ctk.CTkLabel(
             theme_frame,
             text="Tema:",
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             text_color=COLORS['text_muted']
         ).pack(side="left")
 
@@ -483,7 +1183,7 @@ class VisualizerTab(ctk.CTkFrame):
             values=["Default", "Dark", "Forest", "Neutral"],
             width=120,
             height=28,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             command=self._on_theme_change
         )
         self.theme_combo.pack(side="right")
@@ -493,7 +1193,7 @@ class VisualizerTab(ctk.CTkFrame):
         ctk.CTkLabel(
             sidebar,
             text="Diagrammi Trovati:",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_VISUALIZER_FONTS["body_bold"],
             text_color="#1e293b"
         ).pack(anchor="w", padx=15, pady=(10, 5))
 
@@ -507,7 +1207,7 @@ class VisualizerTab(ctk.CTkFrame):
         self.no_diagrams_label = ctk.CTkLabel(
             self.diagram_list,
             text="Nessun diagramma.\n\nGenera documenti nella\ntab 'Generatore' poi\nclicca 'Aggiorna'.",
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             text_color=COLORS['text_muted'],
             justify="center"
         )
@@ -544,7 +1244,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="-",
             width=32,
             height=32,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_VISUALIZER_FONTS["header"],
             fg_color=COLORS['slate'],
             command=self._zoom_out
         ).pack(side="left", padx=2)
@@ -552,7 +1252,7 @@ class VisualizerTab(ctk.CTkFrame):
         self.zoom_label = ctk.CTkLabel(
             zoom_frame,
             text="100%",
-            font=ctk.CTkFont(size=12),
+            font=_VISUALIZER_FONTS["body"],
             width=50
         )
         self.zoom_label.pack(side="left", padx=5)
@@ -562,7 +1262,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="+",
             width=32,
             height=32,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_VISUALIZER_FONTS["header"],
             fg_color=COLORS['slate'],
             command=self._zoom_in
         ).pack(side="left", padx=2)
@@ -572,7 +1272,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="Reset",
             width=50,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             fg_color="transparent",
             text_color=COLORS['primary'],
             hover_color="#e2e8f0",
@@ -588,7 +1288,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="Copia Codice",
             width=100,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             fg_color=COLORS['slate'],
             command=self._copy_code
         ).pack(side="left", padx=3)
@@ -598,7 +1298,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="Esporta PNG",
             width=100,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             fg_color=COLORS['indigo'],
             hover_color=COLORS['indigo_hover'],
             command=self._export_png
@@ -609,7 +1309,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="Esporta SVG",
             width=100,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             fg_color=COLORS['teal'],
             hover_color=COLORS['teal_hover'],
             command=self._export_svg
@@ -620,7 +1320,7 @@ class VisualizerTab(ctk.CTkFrame):
             text="Apri Browser",
             width=100,
             height=32,
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             fg_color=COLORS['purple'],
             hover_color=COLORS['purple_hover'],
             command=self._open_in_browser
@@ -643,7 +1343,7 @@ class VisualizerTab(ctk.CTkFrame):
             self.html_frame = None
             self.fallback_text = ctk.CTkTextbox(
                 viewer_container,
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=_VISUALIZER_FONTS["code"],
                 wrap="word"
             )
             self.fallback_text.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
@@ -659,7 +1359,7 @@ class VisualizerTab(ctk.CTkFrame):
         self.info_label = ctk.CTkLabel(
             info_bar,
             text="Seleziona un diagramma dalla lista",
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             text_color=COLORS['text_muted']
         )
         self.info_label.pack(side="left", padx=15, pady=8)
@@ -667,7 +1367,7 @@ class VisualizerTab(ctk.CTkFrame):
         self.code_size_label = ctk.CTkLabel(
             info_bar,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_VISUALIZER_FONTS["small"],
             text_color=COLORS['text_muted']
         )
         self.code_size_label.pack(side="right", padx=15, pady=8)
@@ -677,7 +1377,7 @@ class VisualizerTab(ctk.CTkFrame):
         if not TKINTERWEB_AVAILABLE or not self.html_frame:
             return
 
-        html = """
+        page = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -711,170 +1411,12 @@ class VisualizerTab(ctk.CTkFrame):
         </body>
         </html>
         """
-        self.html_frame.load_html(html)
+        self.html_frame.load_html(page)
 
     def _generate_mermaid_html(self, diagram: MermaidDiagram) -> str:
         """Generate HTML page for a Mermaid diagram with error handling."""
-        theme_map = {
-            "Default": "default",
-            "Dark": "dark",
-            "Forest": "forest",
-            "Neutral": "neutral"
-        }
-        theme = theme_map.get(self.theme_combo.get(), "default")
-        is_dark = theme == "dark"
-
-        # Escape the code for JavaScript embedding
-        js_escaped_code = (diagram.code
-            .replace('\\', '\\\\')
-            .replace('`', '\\`')
-            .replace('$', '\\$')
-            .replace('</', '<\\/')
-        )
-
-        # HTML escaped for display in error fallback
-        html_escaped_code = (diagram.code
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-        )
-
-        return f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        html, body {{
-            width: 100%;
-            height: 100%;
-            overflow: auto;
-            background: {"#1e293b" if is_dark else "#ffffff"};
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
-        #container {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100%;
-            padding: 20px;
-            transform-origin: center center;
-            transform: scale({self._zoom_level});
-        }}
-        .mermaid {{
-            background: transparent;
-        }}
-        .mermaid svg {{
-            max-width: none !important;
-        }}
-        #error-container {{
-            display: none;
-            padding: 30px;
-            max-width: 800px;
-            margin: 20px auto;
-        }}
-        .error-box {{
-            background: {"#2d1b1b" if is_dark else "#fef2f2"};
-            border: 2px solid {"#7f1d1d" if is_dark else "#fecaca"};
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }}
-        .error-title {{
-            color: {"#fca5a5" if is_dark else "#dc2626"};
-            font-size: 18px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .error-message {{
-            color: {"#fca5a5" if is_dark else "#b91c1c"};
-            font-size: 14px;
-            margin-bottom: 15px;
-        }}
-        .code-fallback {{
-            background: {"#0f172a" if is_dark else "#1e293b"};
-            color: #e2e8f0;
-            padding: 15px;
-            border-radius: 8px;
-            overflow-x: auto;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 12px;
-            white-space: pre-wrap;
-            word-break: break-word;
-        }}
-        .help-text {{
-            color: {"#94a3b8" if is_dark else "#64748b"};
-            font-size: 13px;
-            margin-top: 15px;
-        }}
-        .help-text a {{
-            color: #3b82f6;
-        }}
-    </style>
-</head>
-<body>
-    <div id="container">
-        <pre class="mermaid" id="mermaid-diagram">
-{diagram.code}
-        </pre>
-    </div>
-
-    <div id="error-container">
-        <div class="error-box">
-            <div class="error-title">Errore nel rendering del diagramma</div>
-            <div class="error-message" id="error-message"></div>
-            <p class="help-text">
-                Il diagramma contiene sintassi non valida per Mermaid.
-                <a href="https://mermaid.js.org/syntax/flowchart.html" target="_blank">
-                    Consulta la documentazione Mermaid
-                </a>
-            </p>
-        </div>
-        <h4 style="color: {"#e2e8f0" if is_dark else "#1e293b"}; margin-bottom: 10px;">
-            Codice sorgente:
-        </h4>
-        <pre class="code-fallback">{html_escaped_code}</pre>
-    </div>
-
-    <script>
-        mermaid.initialize({{
-            startOnLoad: false,
-            theme: '{theme}',
-            securityLevel: 'loose',
-            flowchart: {{
-                useMaxWidth: false,
-                htmlLabels: true,
-                curve: 'basis'
-            }},
-            sequence: {{
-                useMaxWidth: false
-            }},
-            logLevel: 'error'
-        }});
-
-        async function renderDiagram() {{
-            const element = document.getElementById('mermaid-diagram');
-            const container = document.getElementById('container');
-            const errorContainer = document.getElementById('error-container');
-
-            try {{
-                const {{ svg }} = await mermaid.render('diagram-svg', element.textContent);
-                element.innerHTML = svg;
-            }} catch (error) {{
-                console.error('Mermaid error:', error);
-                container.style.display = 'none';
-                errorContainer.style.display = 'block';
-                document.getElementById('error-message').textContent =
-                    error.message || 'Errore di sintassi nel codice Mermaid';
-            }}
-        }}
-
-        renderDiagram();
-    </script>
-</body>
-</html>'''
+        theme = _THEME_MAP.get(self.theme_combo.get(), "default")
+        return _mermaid_page(diagram.code, theme, self._zoom_level)
 
     def _refresh_from_preview(self) -> None:
         """Refresh diagrams from preview tab."""
@@ -882,12 +1424,8 @@ class VisualizerTab(ctk.CTkFrame):
         try:
             app = self.winfo_toplevel()
             if hasattr(app, 'preview_tab'):
-                results = app.preview_tab._results
+                results = dict(app.preview_tab._results)
                 self._extract_diagrams(results)
-                self._on_status_update(
-                    f"Trovati {len(self._diagrams)} diagrammi",
-                    "success" if self._diagrams else "info"
-                )
             else:
                 self._on_status_update(
                     "Tab Preview non trovata",
@@ -898,21 +1436,62 @@ class VisualizerTab(ctk.CTkFrame):
             self._on_status_update(f"Errore: {e}", "error")
 
     def _extract_diagrams(self, results: dict[str, str]) -> None:
-        """Extract Mermaid diagrams from document results."""
-        self._diagrams.clear()
-
-        # Clear existing diagram buttons
-        for widget in self.diagram_list.winfo_children():
-            if widget != self.no_diagrams_label:
-                widget.destroy()
+        """
+        Extract Mermaid diagrams from document results.
 
-        pattern = r'```mermaid\s*([\s\S]*?)```'
+        Locating, sanitizing and validating the code blocks runs on a
+        worker thread; the finished diagrams are installed back on the UI
+        thread through the event queue.
 
+        Args:
+            results: Document contents keyed by filename. The caller passes
+                a copy, since the worker reads it after this returns.
+        """
+        self._refresh_seq += 1
+        seq = self._refresh_seq
+
+        def build_task() -> None:
+            try:
+                diagrams = self._scan_diagrams(results)
+            except Exception as e:
+                logger.error("Error building diagrams: %s", e)
+                diagrams = []
+            self.event_queue.put(self._on_diagrams_built, seq, diagrams)
+
+        self._executor.submit(build_task)
+
+    @staticmethod
+    def _scan_diagrams(results: dict[str, str]) -> list[MermaidDiagram]:
+        """Build a MermaidDiagram for every mermaid code block in results."""
+        diagrams: list[MermaidDiagram] = []
         for filename, content in results.items():
-            matches = re.findall(pattern, content)
-            for i, match in enumerate(matches):
-                diagram = MermaidDiagram(match, filename, i + 1)
-                self._diagrams.append(diagram)
+            # Most documents have no diagrams; skip the regex for those
+            if '```mermaid' not in content:
+                continue
+            for i, match in enumerate(_MERMAID_BLOCK_RE.findall(content)):
+                diagrams.append(MermaidDiagram(match, filename, i + 1))
+        return diagrams
+
+    def _on_diagrams_built(self, seq: int, diagrams: list[MermaidDiagram]) -> None:
+        """Install diagrams built by a refresh unless a newer one started."""
+        if seq != self._refresh_seq:
+            return
+
+        self._install_diagrams(diagrams)
+        self._on_status_update(
+            f"Trovati {len(self._diagrams)} diagrammi",
+            "success" if self._diagrams else "info"
+        )
+
+    def _install_diagrams(self, diagrams: list[MermaidDiagram]) -> None:
+        """Replace the current diagrams and rebuild the diagram list."""
+        self._diagrams = diagrams
+
+        # Hide the recycled rows; the needed ones are re-packed in order
+        if self._summary_frame is not None:
+            self._summary_frame.pack_forget()
+        for row in self._row_pool:
+            row['frame'].pack_forget()
 
         # Update UI
         self.diagram_count.configure(text=str(len(self._diagrams)))
@@ -921,69 +1500,111 @@ class VisualizerTab(ctk.CTkFrame):
             self.no_diagrams_label.pack_forget()
             self._populate_diagram_list()
         else:
+            self._invalid_count = 0
             self.no_diagrams_label.pack(pady=30)
 
     def _populate_diagram_list(self) -> None:
         """Populate the diagram list with buttons and validation status."""
-        valid_count = sum(1 for d in self._diagrams if d.is_valid)
-        invalid_count = len(self._diagrams) - valid_count
-
-        # Show summary if there are invalid diagrams
-        if invalid_count > 0:
-            summary = ctk.CTkFrame(self.diagram_list, fg_color="#fef2f2", corner_radius=8)
-            summary.pack(fill="x", pady=(0, 10))
-            ctk.CTkLabel(
-                summary,
-                text=f"Attenzione: {invalid_count} diagrammi con possibili errori",
-                font=ctk.CTkFont(size=10),
-                text_color="#dc2626"
-            ).pack(pady=8)
+        # Invalid diagrams are counted while the rows are filled in
+        invalid_count = 0
 
         for i, diagram in enumerate(self._diagrams):
+            if i == len(self._row_pool):
+                self._row_pool.append(self._create_diagram_row())
+            row = self._row_pool[i]
+
             # Color based on validation status
+            frame_color, status_icon, text_color = _ROW_STYLES[diagram.is_valid]
+
+            row['frame'].configure(fg_color=frame_color)
+            row['button'].configure(
+                text=f"{status_icon}{diagram.diagram_type} #{diagram.index}",
+                text_color=text_color,
+                command=lambda d=diagram: self._select_diagram(d)
+            )
+            row['source_label'].configure(text=f"Da: {diagram.source_file}")
+
+            # Show validation error if any
             if diagram.is_valid:
-                frame_color = "white"
-                status_icon = ""
+                row['warning_label'].pack_forget()
             else:
-                frame_color = "#fefce8"  # Light yellow for warnings
-                status_icon = " "
+                invalid_count += 1
+                row['warning_label'].configure(
+                    text=f"Avviso: {diagram.validation_error}"
+                )
+                row['warning_label'].pack(anchor="w", padx=10, pady=(0, 5))
 
-            btn_frame = ctk.CTkFrame(self.diagram_list, fg_color=frame_color, corner_radius=8)
-            btn_frame.pack(fill="x", pady=3)
+            row['frame'].pack(fill="x", pady=3)
 
-            # Header row with button and status
-            header = ctk.CTkFrame(btn_frame, fg_color="transparent")
-            header.pack(fill="x", padx=5, pady=2)
+        self._invalid_count = invalid_count
 
-            btn = ctk.CTkButton(
-                header,
-                text=f"{status_icon}{diagram.diagram_type} #{diagram.index}",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color="transparent",
-                text_color="#1e293b" if diagram.is_valid else "#b45309",
-                hover_color="#e2e8f0",
-                anchor="w",
-                height=32,
-                command=lambda d=diagram: self._select_diagram(d)
+        # Show summary above the rows if there are invalid diagrams
+        if invalid_count > 0:
+            if self._summary_frame is None:
+                self._summary_frame = ctk.CTkFrame(
+                    self.diagram_list, fg_color="#fef2f2", corner_radius=8
+                )
+                self._summary_label = ctk.CTkLabel(
+                    self._summary_frame,
+                    font=_VISUALIZER_FONTS["caption"],
+                    text_color="#dc2626"
+                )
+                self._summary_label.pack(pady=8)
+            # The banner is reused; only its text depends on the count
+            if invalid_count != self._summary_count:
+                self._summary_label.configure(
+                    text=f"Attenzione: {invalid_count} diagrammi con possibili errori"
+                )
+                self._summary_count = invalid_count
+            self._summary_frame.pack(
+                fill="x", pady=(0, 10), before=self._row_pool[0]['frame']
             )
-            btn.pack(side="left", fill="x", expand=True)
 
-            # Source file label
-            ctk.CTkLabel(
-                btn_frame,
-                text=f"Da: {diagram.source_file}",
-                font=ctk.CTkFont(size=10),
-                text_color=COLORS['text_muted']
-            ).pack(anchor="w", padx=10, pady=(0, 3))
+    def _create_diagram_row(self) -> dict[str, Any]:
+        """
+        Create the widgets for one diagram list entry.
 
-            # Show validation error if any
-            if not diagram.is_valid:
-                ctk.CTkLabel(
-                    btn_frame,
-                    text=f"Avviso: {diagram.validation_error}",
-                    font=ctk.CTkFont(size=9),
-                    text_color="#b45309"
-                ).pack(anchor="w", padx=10, pady=(0, 5))
+        Returns:
+            Dictionary of the row's frame, button and labels; texts and
+            colors are filled in by _populate_diagram_list.
+        """
+        btn_frame = ctk.CTkFrame(self.diagram_list, corner_radius=8)
+
+        # Header row with button and status
+        header = ctk.CTkFrame(btn_frame, fg_color="transparent")
+        header.pack(fill="x", padx=5, pady=2)
+
+        btn = ctk.CTkButton(
+            header,
+            font=_VISUALIZER_FONTS["body_bold"],
+            fg_color="transparent",
+            hover_color="#e2e8f0",
+            anchor="w",
+            height=32
+        )
+        btn.pack(side="left", fill="x", expand=True)
+
+        # Source file label
+        source_label = ctk.CTkLabel(
+            btn_frame,
+            font=_VISUALIZER_FONTS["caption"],
+            text_color=COLORS['text_muted']
+        )
+        source_label.pack(anchor="w", padx=10, pady=(0, 3))
+
+        # Validation error; packed only for invalid diagrams
+        warning_label = ctk.CTkLabel(
+            btn_frame,
+            font=_VISUALIZER_FONTS["tiny"],
+            text_color="#b45309"
+        )
+
+        return {
+            'frame': btn_frame,
+            'button': btn,
+            'source_label': source_label,
+            'warning_label': warning_label,
+        }
 
     def _select_diagram(self, diagram: MermaidDiagram) -> None:
         """Select and display a diagram."""
@@ -991,14 +1612,11 @@ class VisualizerTab(ctk.CTkFrame):
         self._render_diagram()
 
         # Update info bar with validation status
-        if diagram.is_valid:
-            info_text = f"{diagram.diagram_type} da {diagram.source_file}"
-            info_color = COLORS['text_muted']
-        else:
-            info_text = f"{diagram.diagram_type} da {diagram.source_file} (Possibile errore di sintassi)"
-            info_color = "#b45309"
-
-        self.info_label.configure(text=info_text, text_color=info_color)
+        suffix, info_color = _INFO_STYLES[diagram.is_valid]
+        self.info_label.configure(
+            text=f"{diagram.diagram_type} da {diagram.source_file}{suffix}",
+            text_color=info_color
+        )
 
         # Show sanitization info if code was modified
         if diagram.raw_code != diagram.code:
@@ -1010,13 +1628,18 @@ class VisualizerTab(ctk.CTkFrame):
 
     def _render_diagram(self) -> None:
         """Render the current diagram."""
+        # A direct render supersedes any debounced one still pending
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+
         if not self._current_diagram:
             return
 
-        html = self._generate_mermaid_html(self._current_diagram)
+        page = self._generate_mermaid_html(self._current_diagram)
 
         if TKINTERWEB_AVAILABLE and self.html_frame:
-            self.html_frame.load_html(html)
+            self.html_frame.load_html(page)
         else:
             if hasattr(self, 'fallback_text'):
                 self.fallback_text.configure(state="normal")
@@ -1024,27 +1647,68 @@ class VisualizerTab(ctk.CTkFrame):
                 self.fallback_text.insert("1.0", f"Codice Mermaid:\n\n{self._current_diagram.code}")
                 self.fallback_text.configure(state="disabled")
 
+    def _schedule_render(self) -> None:
+        """Render the current diagram once rapid zoom/theme changes settle."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+        self._render_after_id = self.after(
+            self.RENDER_DEBOUNCE_MS, self._render_diagram
+        )
+
     def _on_theme_change(self, value: str) -> None:
         """Handle theme change."""
-        self._render_diagram()
+        self._schedule_render()
 
     def _zoom_in(self) -> None:
         """Zoom in."""
         self._zoom_level = min(3.0, self._zoom_level + 0.25)
-        self.zoom_label.configure(text=f"{int(self._zoom_level * 100)}%")
-        self._render_diagram()
+        self._apply_zoom()
 
     def _zoom_out(self) -> None:
         """Zoom out."""
         self._zoom_level = max(0.25, self._zoom_level - 0.25)
-        self.zoom_label.configure(text=f"{int(self._zoom_level * 100)}%")
-        self._render_diagram()
+        self._apply_zoom()
 
     def _zoom_reset(self) -> None:
         """Reset zoom to 100%."""
         self._zoom_level = 1.0
-        self.zoom_label.configure(text="100%")
-        self._render_diagram()
+        self._apply_zoom()
+
+    def _apply_zoom(self) -> None:
+        """
+        Apply the zoom level, via JS when the HTML widget runs scripts.
+
+        Without JavaScript the page is re-rendered with the scale baked
+        into its CSS.
+        """
+        self.zoom_label.configure(text=f"{int(self._zoom_level * 100)}%")
+        if self._current_diagram and self._javascript_enabled():
+            try:
+                self.html_frame.run_javascript(
+                    f'window.setZoom({self._zoom_level})'
+                )
+                return
+            except Exception as e:
+                logger.debug("JS zoom unavailable, reloading page: %s", e)
+        self._schedule_render()
+
+    def _javascript_enabled(self) -> bool:
+        """
+        Check whether the HTML widget will actually execute scripts.
+
+        tkinterweb exposes run_javascript even when JavaScript is disabled
+        or unsupported, so the frame's javascript_enabled option decides.
+
+        Returns:
+            True if run_javascript calls take effect.
+        """
+        if self.html_frame is None or not hasattr(self.html_frame, 'run_javascript'):
+            return False
+        try:
+            return bool(self.html_frame.cget('javascript_enabled'))
+        except Exception:
+            # Older tkinterweb releases have no such option and no JS engine
+            return False
 
     def _copy_code(self) -> None:
         """Copy current diagram code to clipboard."""
@@ -1087,299 +1751,52 @@ class VisualizerTab(ctk.CTkFrame):
             self._on_status_update("Nessun diagramma selezionato", "warning")
             return
 
-        html = self._generate_full_browser_html()
+        # Stream the fragments straight to the reused temp file so the full
+        # page is never assembled in memory
+        temp_path = self._ensure_temp_path()
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(self._iter_full_browser_html())
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.html',
-            delete=False,
-            encoding='utf-8'
-        ) as f:
-            f.write(html)
-            self._temp_html_path = Path(f.name)
-
-        webbrowser.open(f'file://{self._temp_html_path}')
+        webbrowser.open_new_tab(temp_path.as_uri())
         self._on_status_update("Aperto nel browser", "success")
 
-    def _generate_full_browser_html(self) -> str:
-        """Generate full HTML page for browser viewing with all diagrams."""
-        theme_map = {
-            "Default": "default",
-            "Dark": "dark",
-            "Forest": "forest",
-            "Neutral": "neutral"
-        }
-        theme = theme_map.get(self.theme_combo.get(), "default")
-        is_dark = theme == "dark"
-
-        diagrams_html = ""
-        for i, diagram in enumerate(self._diagrams):
-            # Escape code for HTML display
-            html_escaped_code = (diagram.code
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-            )
-
-            # Status indicator
-            status_class = "" if diagram.is_valid else "has-warning"
-            status_badge = "" if diagram.is_valid else '<span class="warning-badge">Possibile errore</span>'
-
-            diagrams_html += f'''
-            <div class="diagram-card {status_class}" id="diagram-{i}">
-                <div class="diagram-header">
-                    <h3>{diagram.diagram_type} #{diagram.index} {status_badge}</h3>
-                    <span class="source">Da: {diagram.source_file}</span>
-                </div>
-                <div class="diagram-content" id="content-{i}">
-                    <pre class="mermaid" id="mermaid-{i}">
-{diagram.code}
-                    </pre>
-                </div>
-                <div class="error-fallback" id="error-{i}" style="display:none;">
-                    <div class="error-message">
-                        <strong>Errore di rendering:</strong>
-                        <span id="error-msg-{i}"></span>
-                    </div>
-                    <pre class="code-block">{html_escaped_code}</pre>
-                </div>
-                <div class="diagram-actions">
-                    <button onclick="copyCode({i})">Copia Codice</button>
-                    <button onclick="downloadSVG({i})">Scarica SVG</button>
-                </div>
-                <details>
-                    <summary>Mostra codice sorgente</summary>
-                    <pre class="code-block"><code id="code-{i}">{html_escaped_code}</code></pre>
-                </details>
-            </div>
-            '''
-
-        return f'''<!DOCTYPE html>
-<html lang="it">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Mermaid Visualizer - AI Context Studio</title>
-    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: {"#0f172a" if is_dark else "linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%)"};
-            color: {"#e2e8f0" if is_dark else "#1e293b"};
-            min-height: 100vh;
-            padding: 40px 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        header {{
-            text-align: center;
-            margin-bottom: 40px;
-        }}
-        h1 {{
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }}
-        .subtitle {{
-            color: {"#94a3b8" if is_dark else "#64748b"};
-        }}
-        .controls {{
-            display: flex;
-            justify-content: center;
-            gap: 15px;
-            margin-bottom: 30px;
-            flex-wrap: wrap;
-        }}
-        .controls button {{
-            padding: 10px 20px;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 14px;
-            transition: transform 0.2s;
-        }}
-        .controls button:hover {{
-            transform: translateY(-2px);
-        }}
-        .btn-primary {{
-            background: #3b82f6;
-            color: white;
-        }}
-        .diagram-card {{
-            background: {"#1e293b" if is_dark else "white"};
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 40px rgba(0,0,0,{"0.3" if is_dark else "0.1"});
-        }}
-        .diagram-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid {"#334155" if is_dark else "#e2e8f0"};
-        }}
-        .diagram-header h3 {{
-            font-size: 1.25rem;
-        }}
-        .source {{
-            color: {"#94a3b8" if is_dark else "#64748b"};
-            font-size: 0.9rem;
-        }}
-        .diagram-content {{
-            display: flex;
-            justify-content: center;
-            padding: 30px;
-            background: {"#0f172a" if is_dark else "#f8fafc"};
-            border-radius: 12px;
-            margin-bottom: 20px;
-            overflow: auto;
-        }}
-        .diagram-actions {{
-            display: flex;
-            gap: 10px;
-            margin-bottom: 15px;
-        }}
-        .diagram-actions button {{
-            padding: 8px 16px;
-            border: none;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 13px;
-            background: {"#334155" if is_dark else "#e2e8f0"};
-            color: {"#e2e8f0" if is_dark else "#1e293b"};
-        }}
-        .diagram-actions button:hover {{
-            background: {"#475569" if is_dark else "#cbd5e1"};
-        }}
-        details {{
-            margin-top: 15px;
-        }}
-        summary {{
-            cursor: pointer;
-            color: #3b82f6;
-            font-weight: 500;
-        }}
-        .code-block {{
-            background: {"#0f172a" if is_dark else "#1e293b"};
-            color: #e2e8f0;
-            padding: 15px;
-            border-radius: 8px;
-            margin-top: 10px;
-            overflow-x: auto;
-            font-family: 'Consolas', monospace;
-            font-size: 13px;
-        }}
-        .mermaid svg {{
-            max-width: none !important;
-        }}
-        .has-warning {{
-            border-left: 4px solid #f59e0b;
-        }}
-        .warning-badge {{
-            background: #fef3c7;
-            color: #b45309;
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: normal;
-            margin-left: 10px;
-        }}
-        .error-fallback {{
-            background: {"#2d1b1b" if is_dark else "#fef2f2"};
-            border: 2px solid {"#7f1d1d" if is_dark else "#fecaca"};
-            border-radius: 8px;
-            padding: 20px;
-        }}
-        .error-message {{
-            color: {"#fca5a5" if is_dark else "#dc2626"};
-            margin-bottom: 15px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>Mermaid Visualizer</h1>
-            <p class="subtitle">AI Context Studio - {len(self._diagrams)} diagrammi</p>
-        </header>
-
-        <div class="controls">
-            <button class="btn-primary" onclick="window.print()">Stampa / Salva PDF</button>
-        </div>
-
-        {diagrams_html}
-    </div>
+    def _ensure_temp_path(self) -> Path:
+        """
+        Get the temp HTML file used for browser viewing, creating it lazily.
 
-    <script>
-        mermaid.initialize({{
-            startOnLoad: false,
-            theme: '{theme}',
-            securityLevel: 'loose',
-            flowchart: {{ useMaxWidth: false, htmlLabels: true }},
-            sequence: {{ useMaxWidth: false }},
-            logLevel: 'error'
-        }});
+        The file lives in a private temp directory removed at exit.
 
-        // Render each diagram individually to handle errors gracefully
-        async function renderAllDiagrams() {{
-            const diagrams = document.querySelectorAll('.mermaid');
+        Returns:
+            Path of the temp HTML file.
+        """
+        if self._temp_html_path is None:
+            temp_dir = tempfile.mkdtemp(prefix="ai_context_studio_")
+            atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+            self._temp_html_path = Path(temp_dir) / "diagrams.html"
+        return self._temp_html_path
 
-            for (let i = 0; i < diagrams.length; i++) {{
-                const element = diagrams[i];
-                const index = element.id.replace('mermaid-', '');
-                const content = document.getElementById('content-' + index);
-                const errorDiv = document.getElementById('error-' + index);
-                const errorMsg = document.getElementById('error-msg-' + index);
+    def _generate_full_browser_html(self) -> str:
+        """Generate full HTML page for browser viewing with all diagrams."""
+        return "".join(self._iter_full_browser_html())
 
-                try {{
-                    const {{ svg }} = await mermaid.render('svg-' + index, element.textContent.trim());
-                    element.innerHTML = svg;
-                }} catch (error) {{
-                    console.error('Mermaid error for diagram ' + index + ':', error);
-                    content.style.display = 'none';
-                    errorDiv.style.display = 'block';
-                    errorMsg.textContent = error.message || 'Errore di sintassi';
-                }}
-            }}
-        }}
+    def _iter_full_browser_html(self) -> Iterator[str]:
+        """
+        Yield the browser page in fragments.
 
-        renderAllDiagrams();
+        Yields:
+            The page header, one card per diagram, then the footer.
+        """
+        theme = _THEME_MAP.get(self.theme_combo.get(), "default")
 
-        function copyCode(index) {{
-            const code = document.getElementById('code-' + index).textContent;
-            navigator.clipboard.writeText(code).then(() => {{
-                alert('Codice copiato!');
-            }});
-        }}
+        template_vars = dict(
+            _BROWSER_DARK_VARS if theme == "dark" else _BROWSER_LIGHT_VARS
+        )
+        template_vars.update(theme=theme, count=len(self._diagrams))
 
-        function downloadSVG(index) {{
-            const container = document.querySelector('#diagram-' + index + ' .diagram-content');
-            const svg = container.querySelector('svg');
-            if (svg) {{
-                const svgData = new XMLSerializer().serializeToString(svg);
-                const blob = new Blob([svgData], {{type: 'image/svg+xml'}});
-                const url = URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = 'diagram-' + index + '.svg';
-                a.click();
-                URL.revokeObjectURL(url);
-            }} else {{
-                alert('Impossibile scaricare: il diagramma non è stato renderizzato correttamente');
-            }}
-        }}
-    </script>
-</body>
-</html>'''
+        yield _BROWSER_HEAD.format_map(template_vars)
+        for i, diagram in enumerate(self._diagrams):
+            yield _diagram_card(diagram, i)
+        yield _BROWSER_TAIL.format_map(template_vars)
 
     def load_diagrams(self, diagrams_data: list[tuple[str, str]]) -> None:
         """
@@ -1388,21 +1805,20 @@ class VisualizerTab(ctk.CTkFrame):
         Args:
             diagrams_data: List of (source_file, mermaid_code) tuples.
         """
-        self._diagrams.clear()
+        # Invalidate any background refresh still in flight
+        self._refresh_seq += 1
 
-        for widget in self.diagram_list.winfo_children():
-            if widget != self.no_diagrams_label:
-                widget.destroy()
-
-        for i, (source, code) in enumerate(diagrams_data):
-            diagram = MermaidDiagram(code, source, i + 1)
-            self._diagrams.append(diagram)
-
-        self.diagram_count.configure(text=str(len(self._diagrams)))
+        self._install_diagrams([
+            MermaidDiagram(code, source, i + 1)
+            for i, (source, code) in enumerate(diagrams_data)
+        ])
 
         if self._diagrams:
-            self.no_diagrams_label.pack_forget()
-            self._populate_diagram_list()
             self._select_diagram(self._diagrams[0])
-        else:
-            self.no_diagrams_label.pack(pady=30)
+
+    def shutdown(self) -> None:
+        """Release the worker pool and pending render owned by this tab."""
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -5,17 +5,43 @@ Pytest configuration and fixtures for AI Context Studio tests.
 
 from __future__ import annotations
 
-import sys
+import os
+import shutil
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Union
 
 import pytest
 
-# Add src to path for imports - ensure our src package takes precedence
-src_path = str(Path(__file__).parent.parent / "src")
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
+# Maps file names to their contents, for the make_files fixture
+FileSpec = dict[str, Union[str, bytes]]
+
+
+def _write_files(root: Path, spec: FileSpec) -> None:
+    """
+    Write small files with raw os calls, skipping file object overhead.
+
+    Args:
+        root: Directory to create the files in.
+        spec: File names mapped to text (UTF-8 encoded) or bytes.
+    """
+    for name, data in spec.items():
+        fd = os.open(root / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data if isinstance(data, bytes) else data.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture
+def make_files() -> Callable[[Path, FileSpec], None]:
+    """
+    Return a helper that writes a batch of files into a directory.
+
+    Returns:
+        Callable taking the target directory and a name-to-content dict.
+    """
+    return _write_files
 
 
 @pytest.fixture
@@ -30,17 +56,21 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def sample_project(temp_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Create a sample project structure for testing.
+    Create a sample project structure shared by the whole session.
+
+    Tests must not modify it; use sample_project_rw for that.
 
     Args:
-        temp_dir: Temporary directory fixture.
+        tmp_path_factory: Session temporary path factory.
 
     Returns:
         Path to the project root.
     """
+    temp_dir = tmp_path_factory.mktemp("sample_project")
+
     # Create directory structure
     (temp_dir / "src").mkdir()
     (temp_dir / "tests").mkdir()
@@ -81,6 +111,21 @@ def sample_project(temp_dir: Path) -> Path:
     return temp_dir
 
 
+@pytest.fixture
+def sample_project_rw(sample_project: Path, tmp_path: Path) -> Path:
+    """
+    Copy the sample project for a test that modifies it.
+
+    Args:
+        sample_project: Shared sample project fixture.
+        tmp_path: Per-test temporary directory.
+
+    Returns:
+        Path to the copied project root.
+    """
+    return Path(shutil.copytree(sample_project, tmp_path / "project"))
+
+
 @pytest.fixture
 def sample_code_content() -> str:
     """
@@ -133,4 +178,9 @@ def mock_config_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setattr(constants, 'KEY_FILE', config_dir / ".keyfile")
     monkeypatch.setattr(constants, 'MODELS_CACHE_FILE', config_dir / "models_cache.json")
 
+    # Start from a fresh ConfigManager singleton; monkeypatch restores it
+    # on teardown even if the test fails
+    from ai_context_studio.config import ConfigManager
+    monkeypatch.setattr(ConfigManager, '_instance', None)
+
     return config_dir
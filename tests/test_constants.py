@@ -5,6 +5,9 @@ Tests for constants module.
 
 from __future__ import annotations
 
+import os
+import re
+
 import pytest
 
 from ai_context_studio.constants import (
@@ -21,6 +24,8 @@ from ai_context_studio.constants import (
     TOKEN_FACTOR,
 )
 
+_HEX_COLOR_RE = re.compile(r'#[0-9A-Fa-f]{6}')
+
 
 class TestAppConstants:
     """Tests for application metadata constants."""
@@ -51,11 +56,11 @@ class TestFileConstants:
         """Supported extensions should not be empty."""
         assert len(SUPPORTED_EXTENSIONS) > 0
 
-    def test_supported_extensions_are_lowercase(self) -> None:
+    @pytest.mark.parametrize("ext", sorted(SUPPORTED_EXTENSIONS))
+    def test_supported_extensions_are_lowercase(self, ext: str) -> None:
         """All extensions should be lowercase with dot prefix."""
-        for ext in SUPPORTED_EXTENSIONS:
-            assert ext.startswith(".")
-            assert ext == ext.lower()
+        assert ext.startswith(".")
+        assert ext == ext.lower()
 
     def test_common_extensions_included(self) -> None:
         """Common programming file extensions should be included."""
@@ -73,6 +78,11 @@ class TestFileConstants:
         for dirname in common:
             assert dirname in DEFAULT_IGNORED_DIRS
 
+    @pytest.mark.parametrize("dirname", sorted(DEFAULT_IGNORED_DIRS))
+    def test_ignored_dirs_have_no_supported_extension(self, dirname: str) -> None:
+        """The scanner skips ignored names before telling files from dirs."""
+        assert os.path.splitext(dirname)[1].lower() not in SUPPORTED_EXTENSIONS
+
 
 class TestConfigConstants:
     """Tests for configuration constants."""
@@ -109,12 +119,11 @@ class TestColorConstants:
         """Colors dict should not be empty."""
         assert len(COLORS) > 0
 
-    def test_color_values_are_hex(self) -> None:
+    @pytest.mark.parametrize("name, color", sorted(COLORS.items()))
+    def test_color_values_are_hex(self, name: str, color: str) -> None:
         """All color values should be valid hex codes."""
-        for name, color in COLORS.items():
-            assert isinstance(color, str), f"{name} is not a string"
-            assert color.startswith("#"), f"{name} doesn't start with #"
-            assert len(color) == 7, f"{name} is not 7 characters"
+        assert isinstance(color, str), f"{name} is not a string"
+        assert _HEX_COLOR_RE.fullmatch(color), f"{name}={color!r} is not a valid hex color"
 
     def test_essential_colors_present(self) -> None:
         """Essential color keys should be present."""
@@ -134,8 +143,8 @@ class TestFileIcons:
         """Python file icon should be present."""
         assert '.py' in FILE_ICONS
 
-    def test_icon_values_are_strings(self) -> None:
+    @pytest.mark.parametrize("ext, icon", sorted(FILE_ICONS.items()))
+    def test_icon_values_are_strings(self, ext: str, icon: str) -> None:
         """All icon values should be non-empty strings."""
-        for ext, icon in FILE_ICONS.items():
-            assert isinstance(icon, str)
-            assert len(icon) > 0
+        assert isinstance(icon, str)
+        assert len(icon) > 0
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the file tree selection bookkeeping.
+"""
+
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Importing the ui package pulls in customtkinter
+pytest.importorskip("customtkinter")
+
+from ai_context_studio.models import FileInfo  # noqa: E402
+from ai_context_studio.ui.file_tree import OptimizedFileTree  # noqa: E402
+
+
+def _selection_state(*included: bool) -> SimpleNamespace:
+    """
+    Build the selection attributes _set_included works on.
+
+    Args:
+        included: Initial included flag per file; every file is 100 bytes.
+
+    Returns:
+        Namespace standing in for the tree.
+    """
+    files = [
+        FileInfo(Path(f"/p/d{i}/f.py"), f"d{i}/f.py", 100, ".py", flag)
+        for i, flag in enumerate(included)
+    ]
+    return SimpleNamespace(
+        _files=files,
+        _sizes=array('q', [f.size for f in files]),
+        _included_mask=bytearray(included),
+        _included_bytes=100 * sum(included),
+        _selection_version=0,
+    )
+
+
+class TestSelectionVersion:
+    """Tests for the selection version counter."""
+
+    def test_swap_with_equal_size_changes_version(self) -> None:
+        """Swapping files keeps count and size but must bump the version."""
+        tree = _selection_state(True, False)
+
+        OptimizedFileTree._set_included(tree, 0, False)
+        OptimizedFileTree._set_included(tree, 1, True)
+
+        assert tree._included_bytes == 100
+        assert tree._selection_version == 2
+
+    def test_unchanged_flag_keeps_version(self) -> None:
+        """Setting a file to its current state should not bump the version."""
+        tree = _selection_state(True)
+
+        OptimizedFileTree._set_included(tree, 0, True)
+
+        assert tree._selection_version == 0
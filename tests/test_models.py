@@ -19,29 +19,31 @@ from ai_context_studio.models import (
     SmartPreset,
 )
 
+# Fixed paths shared by the dataclass tests; nothing here touches disk
+_FILE_PATH = Path("/test/file.py")
+_TEST_PATH = Path("/test")
+_PROJECT_ROOT = Path("/project")
+
 
 class TestGenerationType:
     """Tests for GenerationType enum."""
 
-    def test_all_types_have_attributes(self) -> None:
+    @pytest.mark.parametrize("gen_type", list(GenerationType), ids=lambda g: g.name)
+    @pytest.mark.parametrize("attr", ["filename", "icon", "label", "color", "description"])
+    def test_all_types_have_attributes(self, gen_type: GenerationType, attr: str) -> None:
         """All generation types should have required attributes."""
-        for gen_type in GenerationType:
-            assert hasattr(gen_type, 'filename')
-            assert hasattr(gen_type, 'icon')
-            assert hasattr(gen_type, 'label')
-            assert hasattr(gen_type, 'color')
-            assert hasattr(gen_type, 'description')
-
-    def test_filenames_are_markdown(self) -> None:
+        assert hasattr(gen_type, attr)
+
+    @pytest.mark.parametrize("gen_type", list(GenerationType), ids=lambda g: g.name)
+    def test_filenames_are_markdown(self, gen_type: GenerationType) -> None:
         """All filenames should end with .md."""
-        for gen_type in GenerationType:
-            assert gen_type.filename.endswith('.md')
+        assert gen_type.filename.endswith('.md')
 
-    def test_labels_are_non_empty(self) -> None:
+    @pytest.mark.parametrize("gen_type", list(GenerationType), ids=lambda g: g.name)
+    def test_labels_are_non_empty(self, gen_type: GenerationType) -> None:
         """All labels should be non-empty strings."""
-        for gen_type in GenerationType:
-            assert isinstance(gen_type.label, str)
-            assert len(gen_type.label) > 0
+        assert isinstance(gen_type.label, str)
+        assert len(gen_type.label) > 0
 
     def test_architecture_type(self) -> None:
         """Architecture type should have correct filename."""
@@ -55,12 +57,11 @@ class TestGenerationType:
 class TestProjectType:
     """Tests for ProjectType enum."""
 
-    def test_all_types_have_attributes(self) -> None:
+    @pytest.mark.parametrize("proj_type", list(ProjectType), ids=lambda p: p.name)
+    @pytest.mark.parametrize("attr", ["icon", "label", "description"])
+    def test_all_types_have_attributes(self, proj_type: ProjectType, attr: str) -> None:
         """All project types should have required attributes."""
-        for proj_type in ProjectType:
-            assert hasattr(proj_type, 'icon')
-            assert hasattr(proj_type, 'label')
-            assert hasattr(proj_type, 'description')
+        assert hasattr(proj_type, attr)
 
     def test_labels_are_unique(self) -> None:
         """All project type labels should be unique."""
@@ -76,10 +77,10 @@ class TestProjectType:
 class TestFocusArea:
     """Tests for FocusArea enum."""
 
-    def test_all_areas_have_attributes(self) -> None:
+    @pytest.mark.parametrize("area", list(FocusArea), ids=lambda a: a.name)
+    def test_all_areas_have_attributes(self, area: FocusArea) -> None:
         """All focus areas should have required attributes."""
-        for area in FocusArea:
-            assert len(area.value) == 3  # icon, label, description
+        assert len(area.value) == 3  # icon, label, description
 
     def test_security_area_exists(self) -> None:
         """Security focus area should exist."""
@@ -92,12 +93,12 @@ class TestFileInfo:
     def test_create_file_info(self) -> None:
         """Should create FileInfo with required fields."""
         file_info = FileInfo(
-            path=Path("/test/file.py"),
+            path=_FILE_PATH,
             relative_path="file.py",
             size=1024,
             extension=".py"
         )
-        assert file_info.path == Path("/test/file.py")
+        assert file_info.path is _FILE_PATH
         assert file_info.relative_path == "file.py"
         assert file_info.size == 1024
         assert file_info.extension == ".py"
@@ -106,7 +107,7 @@ class TestFileInfo:
     def test_file_info_default_included(self) -> None:
         """FileInfo should be included by default."""
         file_info = FileInfo(
-            path=Path("/test"),
+            path=_TEST_PATH,
             relative_path="test",
             size=100,
             extension=".py"
@@ -116,7 +117,7 @@ class TestFileInfo:
     def test_file_info_excluded(self) -> None:
         """FileInfo can be marked as excluded."""
         file_info = FileInfo(
-            path=Path("/test"),
+            path=_TEST_PATH,
             relative_path="test",
             size=100,
             extension=".py",
@@ -124,14 +125,28 @@ class TestFileInfo:
         )
         assert file_info.included is False
 
+    def test_content_iter_streams_chunks(self, temp_dir: Path) -> None:
+        """content_iter should yield the file in bounded chunks."""
+        path = temp_dir / "data.py"
+        path.write_bytes(b"x" * 10)
+        file_info = FileInfo(
+            path=path,
+            relative_path="data.py",
+            size=10,
+            extension=".py"
+        )
+        chunks = list(file_info.content_iter(chunk_size=4))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert b"".join(chunks) == b"x" * 10
+
 
 class TestScanResult:
     """Tests for ScanResult dataclass."""
 
     def test_create_scan_result(self) -> None:
         """Should create ScanResult with root path."""
-        result = ScanResult(root_path=Path("/project"))
-        assert result.root_path == Path("/project")
+        result = ScanResult(root_path=_PROJECT_ROOT)
+        assert result.root_path is _PROJECT_ROOT
         assert result.files == []
         assert result.total_size == 0
         assert result.estimated_tokens == 0
@@ -141,13 +156,13 @@ class TestScanResult:
         """Should store file list."""
         files = [
             FileInfo(
-                path=Path("/project/main.py"),
+                path=_PROJECT_ROOT / "main.py",
                 relative_path="main.py",
                 size=500,
                 extension=".py"
             )
         ]
-        result = ScanResult(root_path=Path("/project"), files=files)
+        result = ScanResult(root_path=_PROJECT_ROOT, files=files)
         assert len(result.files) == 1
 
 
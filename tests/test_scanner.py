@@ -5,13 +5,71 @@ Tests for the file scanner module.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 import pytest
 
+from ai_context_studio import scanner as scanner_module
+from ai_context_studio.constants import MAX_FILE_SIZE
 from ai_context_studio.scanner import FastFileScanner
 
 
+@pytest.fixture(scope="class")
+def shared_scanner() -> FastFileScanner:
+    """One scanner reused by every test in a class."""
+    return FastFileScanner()
+
+
+@pytest.fixture
+def scanner(shared_scanner: FastFileScanner) -> FastFileScanner:
+    """
+    The class's shared scanner, with per-test state reset.
+
+    Args:
+        shared_scanner: Class-scoped scanner fixture.
+
+    Returns:
+        Scanner with no pending cancel and no progress callback.
+    """
+    shared_scanner._cancel_flag.clear()
+    shared_scanner._progress_callback = None
+    return shared_scanner
+
+
+# Canned contents for the sample project's files, keyed by file name
+_CANNED_CONTENTS: dict[str, str] = {
+    "main.py": "def main():\n    pass\n",
+    "utils.py": "def helper():\n    return 42\n",
+    "test_main.py": "def test_main():\n    assert True\n",
+    "README.md": "# Sample Project\n",
+    "requirements.txt": "pytest>=7.0\n",
+}
+
+
+@pytest.fixture
+def canned_reads(
+    scanner: FastFileScanner,
+    monkeypatch: pytest.MonkeyPatch
+) -> FastFileScanner:
+    """
+    The scanner with file reads served from _CANNED_CONTENTS, not disk.
+
+    Args:
+        scanner: Scanner fixture to patch.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        The patched scanner.
+    """
+    monkeypatch.setattr(
+        scanner, "_read_file_safe", lambda path: _CANNED_CONTENTS.get(path.name)
+    )
+    return scanner
+
+
 class TestFastFileScanner:
     """Tests for FastFileScanner class."""
 
@@ -20,46 +78,52 @@ class TestFastFileScanner:
         scanner = FastFileScanner()
         assert scanner is not None
 
-    def test_scan_empty_directory(self, temp_dir: Path) -> None:
+    def test_scan_empty_directory(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path
+    ) -> None:
         """Should handle empty directory."""
-        scanner = FastFileScanner()
         result = scanner.scan(temp_dir)
 
         assert result.root_path == temp_dir
         assert result.files == []
         assert result.total_size == 0
 
-    def test_scan_sample_project(self, sample_project: Path) -> None:
+    def test_scan_sample_project(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path
+    ) -> None:
         """Should find files in sample project."""
-        scanner = FastFileScanner()
         result = scanner.scan(sample_project)
 
         assert result.root_path == sample_project
         assert len(result.files) > 0
 
         # Should find Python files
-        py_files = [f for f in result.files if f.extension == '.py']
-        assert len(py_files) >= 2  # main.py and utils.py
-
-    def test_scan_ignores_pycache(self, sample_project: Path) -> None:
-        """Should ignore __pycache__ directory."""
-        scanner = FastFileScanner()
+        py_count = sum(1 for f in result.files if f.extension == '.py')
+        assert py_count >= 2  # main.py and utils.py
+
+    @pytest.mark.parametrize("ignored", ["__pycache__", ".git"])
+    def test_scan_ignores_dir(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path,
+        ignored: str
+    ) -> None:
+        """Should ignore __pycache__ and .git directories."""
         result = scanner.scan(sample_project)
 
-        for file_info in result.files:
-            assert "__pycache__" not in file_info.relative_path
+        rels = {f.relative_path for f in result.files}
+        assert not any(ignored in rel for rel in rels)
 
-    def test_scan_ignores_git(self, sample_project: Path) -> None:
-        """Should ignore .git directory."""
-        scanner = FastFileScanner()
-        result = scanner.scan(sample_project)
-
-        for file_info in result.files:
-            assert ".git" not in file_info.relative_path
-
-    def test_files_have_correct_attributes(self, sample_project: Path) -> None:
+    def test_files_have_correct_attributes(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path
+    ) -> None:
         """Scanned files should have all required attributes."""
-        scanner = FastFileScanner()
         result = scanner.scan(sample_project)
 
         for file_info in result.files:
@@ -69,43 +133,86 @@ class TestFastFileScanner:
             assert file_info.extension.startswith('.')
             assert file_info.included is True
 
-    def test_read_files(self, sample_project: Path) -> None:
-        """Should read file contents."""
-        scanner = FastFileScanner()
-        result = scanner.scan(sample_project)
-        scanner.read_files(result)
-
-        assert len(result.content_map) > 0
-
-        # Check main.py content
-        main_content = None
-        for path, content in result.content_map.items():
-            if path.endswith("main.py"):
-                main_content = content
-                break
-
-        assert main_content is not None
-        assert "def main" in main_content
-
-    def test_scan_with_progress_callback(self, sample_project: Path) -> None:
+    def test_read_files(
+        self,
+        canned_reads: FastFileScanner,
+        sample_project: Path
+    ) -> None:
+        """Should store each included file's content by relative path."""
+        result = canned_reads.scan(sample_project)
+        canned_reads.read_files(result)
+
+        assert len(result.content_map) == len(result.files)
+
+        main_rel = os.path.join("src", "main.py")
+        assert result.content_map[main_rel] == _CANNED_CONTENTS["main.py"]
+
+    def test_read_files_parallel_matches_serial(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sharded process-pool reads should match a serial read."""
+        serial = scanner.scan(sample_project)
+        scanner.read_files(serial)
+
+        monkeypatch.setattr(scanner_module, "PARALLEL_READ_THRESHOLD", 1)
+        parallel = scanner.scan(sample_project)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            scanner.read_files(parallel, executor=pool)
+
+        assert list(parallel.content_map.items()) == list(serial.content_map.items())
+
+    def test_parallel_scan_matches_serial(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Wide roots scanned on threads should match a serial scan."""
+        (temp_dir / "setup.py").write_text("pass")
+        for i in range(8):
+            pkg = temp_dir / f"pkg{i}" / "sub"
+            pkg.mkdir(parents=True)
+            (pkg.parent / "__init__.py").write_text("")
+            (pkg / f"mod{i}.py").write_text(f"x = {i}")
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "node_modules" / "dep.js").write_text("")
+
+        parallel = scanner.scan(temp_dir)
+
+        monkeypatch.setattr(scanner_module, "PARALLEL_SCAN_MIN_DIRS", 100)
+        serial = scanner.scan(temp_dir)
+
+        assert len(parallel.files) == 17
+        assert [f.relative_path for f in parallel.files] == [
+            f.relative_path for f in serial.files
+        ]
+
+    def test_scan_with_progress_callback(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path
+    ) -> None:
         """Should call progress callback during scan."""
-        scanner = FastFileScanner()
-        progress_calls: list[tuple[str, int]] = []
+        calls = 0
+        last_pct: Optional[int] = None
 
         def callback(msg: str, pct: int) -> None:
-            progress_calls.append((msg, pct))
+            nonlocal calls, last_pct
+            calls += 1
+            last_pct = pct
 
         scanner.set_progress_callback(callback)
-        result = scanner.scan(sample_project)
+        scanner.scan(sample_project)
 
-        assert len(progress_calls) > 0
+        assert calls > 0
         # Last call should be completion
-        assert progress_calls[-1][1] == 100
+        assert last_pct == 100
 
-    def test_cancel_scan(self, sample_project: Path) -> None:
+    def test_cancel_scan(self, scanner: FastFileScanner, sample_project: Path) -> None:
         """Should be able to cancel scan."""
-        scanner = FastFileScanner()
-
         # Cancel before starting
         scanner.cancel()
         result = scanner.scan(sample_project)
@@ -113,9 +220,12 @@ class TestFastFileScanner:
         # Scan should complete but result may vary
         assert result.root_path == sample_project
 
-    def test_nonexistent_directory(self, temp_dir: Path) -> None:
+    def test_nonexistent_directory(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path
+    ) -> None:
         """Should handle nonexistent directory gracefully."""
-        scanner = FastFileScanner()
         nonexistent = temp_dir / "does_not_exist"
 
         # This should not raise an exception
@@ -126,16 +236,21 @@ class TestFastFileScanner:
 class TestFileFiltering:
     """Tests for file filtering during scan."""
 
-    def test_only_supported_extensions(self, temp_dir: Path) -> None:
+    def test_only_supported_extensions(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path,
+        make_files: Callable[..., None]
+    ) -> None:
         """Should only include supported file extensions."""
-        # Create various files
-        (temp_dir / "script.py").write_text("# Python")
-        (temp_dir / "image.png").write_bytes(b'\x89PNG')
-        (temp_dir / "binary.exe").write_bytes(b'\x00\x00')
-        (temp_dir / "document.pdf").write_bytes(b'%PDF')
-        (temp_dir / "data.json").write_text('{}')
+        make_files(temp_dir, {
+            "script.py": "# Python",
+            "image.png": b'\x89PNG',
+            "binary.exe": b'\x00\x00',
+            "document.pdf": b'%PDF',
+            "data.json": '{}',
+        })
 
-        scanner = FastFileScanner()
         result = scanner.scan(temp_dir)
 
         extensions = {f.extension for f in result.files}
@@ -146,14 +261,136 @@ class TestFileFiltering:
         assert '.exe' not in extensions
         assert '.pdf' not in extensions
 
-    def test_hidden_files_ignored(self, temp_dir: Path) -> None:
+    def test_extensions_are_interned(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path,
+        make_files: Callable[..., None]
+    ) -> None:
+        """Files with the same extension should share one string object."""
+        make_files(temp_dir, {"a.PY": "# upper", "b.py": "# lower"})
+
+        result = scanner.scan(temp_dir)
+
+        first, second = (f.extension for f in result.files)
+        assert first == '.py'
+        assert first is second
+
+    def test_hidden_files_ignored(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path,
+        make_files: Callable[..., None]
+    ) -> None:
         """Should ignore hidden files (starting with dot)."""
-        (temp_dir / ".hidden.py").write_text("# Hidden")
-        (temp_dir / "visible.py").write_text("# Visible")
+        make_files(temp_dir, {".hidden.py": "# Hidden", "visible.py": "# Visible"})
 
-        scanner = FastFileScanner()
         result = scanner.scan(temp_dir)
 
         paths = [f.relative_path for f in result.files]
         assert "visible.py" in paths
         assert ".hidden.py" not in paths
+
+    def test_scan_skips_large_files(
+        self,
+        scanner: FastFileScanner,
+        temp_dir: Path
+    ) -> None:
+        """Should skip files larger than MAX_FILE_SIZE."""
+        (temp_dir / "small.py").write_text("# Small")
+        large_file = temp_dir / "large.py"
+        large_file.touch()
+        # Sets the length with one truncate call; no data is written
+        os.truncate(large_file, MAX_FILE_SIZE + 1)
+
+        result = scanner.scan(temp_dir)
+
+        paths = [f.relative_path for f in result.files]
+        assert "small.py" in paths
+        assert "large.py" not in paths
+
+
+class TestScanCache:
+    """Tests for persisted scan results."""
+
+    def test_no_cache_without_cache_dir(
+        self,
+        scanner: FastFileScanner,
+        sample_project: Path
+    ) -> None:
+        """Scanners without a cache directory should never hit the cache."""
+        scanner.scan(sample_project)
+        assert scanner.load_cached(sample_project) is None
+
+    def test_cache_round_trip(
+        self,
+        sample_project: Path,
+        tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """An unchanged project should be served from the cache."""
+        scanner = FastFileScanner(cache_dir=tmp_path_factory.mktemp("cache"))
+        assert scanner.load_cached(sample_project) is None
+
+        scanned = scanner.scan(sample_project)
+        cached = scanner.load_cached(sample_project)
+
+        assert cached is not None
+        assert [(f.path, f.relative_path, f.size, f.extension) for f in cached.files] == [
+            (f.path, f.relative_path, f.size, f.extension) for f in scanned.files
+        ]
+        assert cached.total_size == scanned.total_size
+        assert cached.estimated_tokens == scanned.estimated_tokens
+
+    def test_cache_invalidated_by_new_file(
+        self,
+        sample_project_rw: Path,
+        tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """Adding a file in a scanned directory should invalidate the cache."""
+        scanner = FastFileScanner(cache_dir=tmp_path_factory.mktemp("cache"))
+        scanner.scan(sample_project_rw)
+
+        src_dir = sample_project_rw / "src"
+        (src_dir / "new_module.py").write_text("x = 1")
+        stat = src_dir.stat()
+        os.utime(src_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert scanner.load_cached(sample_project_rw) is None
+
+    def test_cache_invalidated_by_edited_file(
+        self,
+        sample_project_rw: Path,
+        tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """Editing a file in place should invalidate the cache."""
+        scanner = FastFileScanner(cache_dir=tmp_path_factory.mktemp("cache"))
+        scanner.scan(sample_project_rw)
+
+        src_dir = sample_project_rw / "src"
+        dir_stat = src_dir.stat()
+        main_py = src_dir / "main.py"
+        main_py.write_text("def main():\n    return 'edited'\n", encoding='utf-8')
+        file_stat = main_py.stat()
+        os.utime(main_py, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+        # Editing must not rely on the directory mtime changing
+        os.utime(src_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        assert scanner.load_cached(sample_project_rw) is None
+
+    def test_cache_invalidated_by_shrunk_large_file(
+        self,
+        temp_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """A file skipped for size that shrinks should invalidate the cache."""
+        large_file = temp_dir / "large.py"
+        large_file.touch()
+        os.truncate(large_file, MAX_FILE_SIZE + 1)
+        scanner = FastFileScanner(cache_dir=tmp_path_factory.mktemp("cache"))
+        assert scanner.scan(temp_dir).files == []
+
+        dir_stat = temp_dir.stat()
+        os.truncate(large_file, 10)
+        os.utime(temp_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        assert scanner.load_cached(temp_dir) is None
@@ -13,21 +13,14 @@ from ai_context_studio.token_estimator import TokenEstimator
 class TestTokenEstimation:
     """Tests for token estimation functionality."""
 
-    def test_estimate_tokens_empty(self) -> None:
-        """Empty string should have zero tokens."""
-        assert TokenEstimator.estimate_tokens("") == 0
-
-    def test_estimate_tokens_short(self) -> None:
-        """Short strings should have few tokens."""
-        # With TOKEN_FACTOR of 4, 8 chars = 2 tokens
-        assert TokenEstimator.estimate_tokens("12345678") == 2
-
-    def test_estimate_tokens_long(self) -> None:
-        """Longer strings should have proportionally more tokens."""
-        text = "a" * 1000
-        tokens = TokenEstimator.estimate_tokens(text)
-        # With TOKEN_FACTOR of 4, 1000 chars = 250 tokens
-        assert tokens == 250
+    @pytest.mark.parametrize(
+        "text_len, expected",
+        [(0, 0), (8, 2), (1000, 250)],
+        ids=["empty", "short", "long"],
+    )
+    def test_estimate_tokens(self, text_len: int, expected: int) -> None:
+        """Token count should scale with length (TOKEN_FACTOR of 4)."""
+        assert TokenEstimator.estimate_tokens("a" * text_len) == expected
 
     def test_estimate_tokens_real_code(self, sample_code_content: str) -> None:
         """Should estimate tokens for real code."""
@@ -103,18 +96,19 @@ class TestUsagePercentage:
 class TestFormatTokenCount:
     """Tests for token count formatting."""
 
-    def test_format_small_number(self) -> None:
-        """Small numbers should remain as-is."""
-        assert TokenEstimator.format_token_count(42) == "42"
-        assert TokenEstimator.format_token_count(999) == "999"
-
-    def test_format_thousands(self) -> None:
-        """Thousands should be comma-separated."""
-        assert TokenEstimator.format_token_count(1000) == "1,000"
-        assert TokenEstimator.format_token_count(10000) == "10,000"
-        assert TokenEstimator.format_token_count(999999) == "999,999"
-
-    def test_format_millions(self) -> None:
-        """Millions should use M suffix."""
-        assert TokenEstimator.format_token_count(1000000) == "1.0M"
-        assert TokenEstimator.format_token_count(2500000) == "2.5M"
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (42, "42"),
+            (999, "999"),
+            (1000, "1,000"),
+            (10000, "10,000"),
+            (999999, "999,999"),
+            (1000000, "1.0M"),
+            (2500000, "2.5M"),
+        ],
+        ids=str,
+    )
+    def test_format_token_count(self, value: int, expected: str) -> None:
+        """Numbers below a million are comma-separated, larger ones use M."""
+        assert TokenEstimator.format_token_count(value) == expected
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for tooltip scheduling.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+
+# Importing the ui package pulls in customtkinter
+pytest.importorskip("customtkinter")
+
+from ai_context_studio.ui.tooltip import ToolTip  # noqa: E402
+
+
+class _FakeWidget:
+    """Widget stand-in recording bindings and pending after() callbacks."""
+
+    def __init__(self) -> None:
+        self.pending: dict[str, Callable[[], Any]] = {}
+        self._next_id = 0
+
+    def bind(self, sequence: str, func: Callable[..., Any]) -> None:
+        pass
+
+    def after(self, delay: int, func: Callable[[], Any]) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self.pending.pop(after_id, None)
+
+
+class TestToolTipScheduling:
+    """Tests for enter/leave handling of the hover delay."""
+
+    def test_repeated_enter_schedules_once(self) -> None:
+        """Enters while a show is pending should not queue another."""
+        widget = _FakeWidget()
+        tooltip = ToolTip(widget, "help")
+
+        tooltip._on_enter(SimpleNamespace(time=1000))
+        tooltip._on_enter(SimpleNamespace(time=1010))
+
+        assert len(widget.pending) == 1
+
+    def test_enter_right_after_leave_schedules_show(self) -> None:
+        """A Leave/Enter pair with the same timestamp should still show."""
+        widget = _FakeWidget()
+        tooltip = ToolTip(widget, "help")
+
+        tooltip._on_enter(SimpleNamespace(time=1000))
+        # Moving between a CTk widget's canvas and label fires both at once
+        tooltip._on_leave(SimpleNamespace(time=1020))
+        tooltip._on_enter(SimpleNamespace(time=1020))
+
+        assert tooltip.scheduled_id in widget.pending
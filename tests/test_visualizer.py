@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the Mermaid visualizer helpers.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+# The visualizer module builds on customtkinter widgets
+pytest.importorskip("customtkinter")
+
+from ai_context_studio.ui.visualizer_tab import (  # noqa: E402
+    MermaidDiagram,
+    MermaidSanitizer,
+    VisualizerTab,
+    _diagram_keyword,
+    _mermaid_page,
+)
+
+
+class TestDiagramKeyword:
+    """Tests for diagram type keyword detection."""
+
+    @pytest.mark.parametrize(
+        "first_line, expected",
+        [
+            ("graph td", "graph"),
+            ("graph td;", "graph"),
+            ("gitgraph:", "gitgraph"),
+            ("statediagram-v2", "statediagram"),
+            ("sankey-beta", "sankey"),
+            ("pie title pets", "pie"),
+            ("unknown", ""),
+            ("", ""),
+        ],
+    )
+    def test_diagram_keyword(self, first_line: str, expected: str) -> None:
+        """Should resolve the keyword, ignoring suffixes and punctuation."""
+        assert _diagram_keyword(first_line) == expected
+
+    def test_gitgraph_header_with_colon_is_valid(self) -> None:
+        """The 'gitGraph:' header form should validate as a Git Graph."""
+        code = "gitGraph:\n    commit\n    branch develop\n    commit\n"
+
+        assert MermaidSanitizer.validate(code) == (True, "")
+        assert MermaidDiagram(code, "doc.md", 0).diagram_type == "Git Graph"
+
+
+class _FakeHtmlFrame:
+    """HtmlFrame stand-in exposing run_javascript and an option table."""
+
+    def __init__(self, **options: Any) -> None:
+        self._options = options
+
+    def run_javascript(self, script: str) -> None:
+        pass
+
+    def cget(self, option: str) -> Any:
+        return self._options[option]
+
+
+class TestZoom:
+    """Tests for zoom rendering and JavaScript detection."""
+
+    def test_page_bakes_zoom_into_css(self) -> None:
+        """Pages should carry the zoom level without relying on scripts."""
+        page = _mermaid_page("graph TD\n    A-->B", "default", 1.5)
+        assert "transform: scale(1.5);" in page
+
+    @pytest.mark.parametrize(
+        "frame, expected",
+        [
+            (None, False),
+            (_FakeHtmlFrame(javascript_enabled=True), True),
+            (_FakeHtmlFrame(javascript_enabled=False), False),
+            (_FakeHtmlFrame(), False),
+        ],
+        ids=["no-frame", "enabled", "disabled", "no-option"],
+    )
+    def test_javascript_enabled(self, frame: Any, expected: bool) -> None:
+        """JS zoom should only be used when the frame really runs scripts."""
+        tab = SimpleNamespace(html_frame=frame)
+        assert VisualizerTab._javascript_enabled(tab) is expected
+
+
+class TestShutdown:
+    """Tests for releasing the tab's background resources."""
+
+    def test_shutdown_stops_executor_and_pending_render(self) -> None:
+        """Shutdown should cancel the debounced render and stop the pool."""
+        cancelled: list[str] = []
+        tab = SimpleNamespace(
+            _render_after_id="after#1",
+            after_cancel=cancelled.append,
+            _executor=ThreadPoolExecutor(max_workers=1),
+        )
+
+        VisualizerTab.shutdown(tab)
+
+        assert cancelled == ["after#1"]
+        assert tab._render_after_id is None
+        with pytest.raises(RuntimeError):
+            tab._executor.submit(print)